@@ -49,7 +49,9 @@ def create_theme_switcher(current_theme="dark"):
                 children=[
                     html.Button(
                         theme_data["icon"],
-                        id=f"theme-{theme_key}",
+                        # Pattern-matching id: one ALL-input callback in
+                        # main.py handles every theme button
+                        id={"type": "theme-btn", "name": theme_key},
                         title=theme_data["name"],
                         style={
                             "background": theme["brand_primary"] if theme_key == current_theme else "transparent",
@@ -4,6 +4,8 @@ Fixed CSV Data Loader for Waste Management Dashboard
 Integrates properly with consolidated callbacks
 """
 
+import functools
+import numpy as np
 import pandas as pd
 import logging
 from dash import html, dash_table, dcc
@@ -18,6 +20,87 @@ logger = logging.getLogger(__name__)
 # Global data storage
 _cached_data = None
 
+# Monotonic token identifying the currently cached dataset. Bumped on
+# every refresh so memoized per-filter results are keyed to the data
+# they were computed from and can never outlive it.
+_data_version = 0
+
+def _read_csv_arrow(csv_path):
+    """Parse the CSV with PyArrow's multithreaded reader, or None
+
+    pandas' parser is single-threaded; Arrow splits the file into blocks
+    and parses them in parallel, then hands over a regular pandas frame
+    so the cleaning code below is unchanged. Non-UTF-8 files (or a
+    missing pyarrow) return None and the encoding fallback loop runs.
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+        # 32MB blocks give each worker thread a sizable parallel chunk
+        # even on single-digit-MB uploads
+        table = pa_csv.read_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=32 << 20)
+        )
+        # Non-UTF-8 input comes back as binary columns instead of an
+        # error - hand those files to the encoding fallback loop
+        if any(pa.types.is_binary(field.type) for field in table.schema):
+            logger.warning("pyarrow read produced binary columns (non-UTF-8 CSV), falling back to pandas")
+            return None
+        # split_blocks + self_destruct hand Arrow buffers to pandas
+        # without doubling peak memory during the conversion
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        logger.info(f"✅ Successfully loaded CSV with pyarrow reader")
+        return df
+    except Exception as e:
+        logger.warning(f"pyarrow CSV read failed ({e}), falling back to pandas")
+        return None
+
+
+def _read_feather_sidecar(csv_path):
+    """Return the cleaned DataFrame from the Arrow sidecar, or None
+
+    The sidecar holds the already-parsed, already-cleaned frame; reading
+    it is orders of magnitude cheaper than re-parsing the CSV. Only used
+    when it is at least as new as the CSV it was built from.
+    """
+    sidecar = csv_path + '.feather'
+    try:
+        if (os.path.exists(sidecar)
+                and os.path.getmtime(sidecar) >= os.path.getmtime(csv_path)):
+            df = pd.read_feather(sidecar)
+            logger.info(f"✅ Loaded {len(df)} records from Arrow sidecar {sidecar}")
+            return df
+    except Exception as e:
+        logger.warning(f"Could not read Arrow sidecar {sidecar}: {e}")
+    return None
+
+
+def _write_feather_sidecar(csv_path, df):
+    """Persist the cleaned frame next to the CSV for fast future loads"""
+    sidecar = csv_path + '.feather'
+    try:
+        df.reset_index(drop=True).to_feather(sidecar)
+        logger.info(f"Wrote Arrow sidecar {sidecar}")
+    except Exception as e:
+        # Read-only filesystem or missing pyarrow - the CSV path still works
+        logger.warning(f"Could not write Arrow sidecar {sidecar}: {e}")
+
+
+def _encode_categoricals(df):
+    """Dictionary-encode the low-cardinality string columns
+
+    agency/cluster/site/vehicle repeat a handful of values over thousands
+    of rows. As category dtype, equality filters compare small integer
+    codes instead of hashing strings and nunique() reads the code table,
+    so every per-request pass over these columns gets cheaper. No-op for
+    columns that are absent or already categorical.
+    """
+    for column in ('agency', 'cluster', 'site', 'vehicle', 'Vehicle No'):
+        if column in df.columns and df[column].dtype != 'category':
+            df[column] = df[column].astype('category')
+    return df
+
 def load_csv_data():
     """
     Load CSV data from file or browser API
@@ -26,52 +109,64 @@ def load_csv_data():
     try:
         # Try to load from uploaded file first
         csv_files = []
-        
+
         # Check common CSV file locations
         possible_paths = [
             'waste_management_data_updated.csv',
-            'data/waste_management_data_updated.csv', 
+            'data/waste_management_data_updated.csv',
             '/tmp/uploads/waste_management_data_updated.csv',
             '/tmp/uploads/dash_/uploads/waste_management_data_updated.csv'
         ]
-        
+
         for path in possible_paths:
             if os.path.exists(path):
                 csv_files.append(path)
-        
+
         if csv_files:
             # Load the first found CSV file
             csv_path = csv_files[0]
+
+            # Arrow sidecar short-circuits the whole parse+clean pass
+            # when the CSV hasn't changed since it was written
+            cached = _read_feather_sidecar(csv_path)
+            if cached is not None:
+                # Older sidecars may predate categorical encoding
+                return _encode_categoricals(cached)
+
             logger.info(f"Loading CSV from: {csv_path}")
-            
-            # Try different encodings
-            encodings = ['utf-8', 'latin-1', 'cp1252']
-            df = None
-            
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(csv_path, encoding=encoding)
-                    logger.info(f"✅ Successfully loaded CSV with {encoding} encoding")
-                    break
-                except UnicodeDecodeError:
-                    logger.warning(f"Failed to load with {encoding} encoding, trying next...")
-                    continue
-                except Exception as e:
-                    logger.error(f"Error loading with {encoding}: {e}")
-                    continue
-            
+
+            # PyArrow's multithreaded parser first; pandas' encoding
+            # fallback loop only runs when it can't read the file
+            df = _read_csv_arrow(csv_path)
+
+            if df is None:
+                # Try different encodings
+                encodings = ['utf-8', 'latin-1', 'cp1252']
+
+                for encoding in encodings:
+                    try:
+                        df = pd.read_csv(csv_path, encoding=encoding)
+                        logger.info(f"✅ Successfully loaded CSV with {encoding} encoding")
+                        break
+                    except UnicodeDecodeError:
+                        logger.warning(f"Failed to load with {encoding} encoding, trying next...")
+                        continue
+                    except Exception as e:
+                        logger.error(f"Error loading with {encoding}: {e}")
+                        continue
+
             if df is None:
                 logger.error("Failed to load CSV with any encoding")
                 return get_sample_data()
-            
+
             # Ensure Date column is datetime
             if 'Date' in df.columns:
                 df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-            
+
             # Add derived columns
             if 'weight' in df.columns:
                 df['weight_tons'] = df['weight'] / 1000
-            
+
             # Clean data - remove rows with missing essential columns
             essential_columns = ['agency', 'cluster', 'site']
             for col in essential_columns:
@@ -79,15 +174,29 @@ def load_csv_data():
                     df = df.dropna(subset=[col])
                     # Convert to string and clean
                     df[col] = df[col].astype(str).str.strip().str.lower()
-            
+
+            # Keep rows date-sorted so date-range filters can binary-search
+            # a slice instead of scanning the whole Date column
+            if 'Date' in df.columns and not df['Date'].is_monotonic_increasing:
+                df = df.sort_values('Date', kind='stable').reset_index(drop=True)
+
+            df = _encode_categoricals(df)
+
+            # Surface schema problems once at load time instead of the
+            # stats path silently reporting zeros on every request
+            for names in (('Net Weight', 'weight'), ('Vehicle No', 'vehicle')):
+                if not any(name in df.columns for name in names):
+                    logger.warning(f"Dataset has no {' / '.join(names)} column; filter stats will report 0")
+
             logger.info(f"Successfully loaded and cleaned {len(df)} records from {csv_path}")
+            _write_feather_sidecar(csv_path, df)
             return df
-        
+
         else:
             # No CSV file found, return sample data
             logger.warning("No CSV file found, using sample data")
             return get_sample_data()
-        
+
     except Exception as e:
         logger.error(f"Error loading CSV data: {e}")
         return get_sample_data()
@@ -120,7 +229,8 @@ def get_sample_data():
     df = pd.DataFrame(sample_data)
     df['Date'] = pd.to_datetime(df['Date'])
     df['weight_tons'] = df['weight'] / 1000
-    
+    df = _encode_categoricals(df)
+
     logger.info(f"Using sample data with {len(df)} records")
     return df
 
@@ -137,10 +247,17 @@ def get_global_data():
 
 def refresh_cached_data():
     """Force refresh of cached data"""
-    global _cached_data
+    global _cached_data, _data_version
     _cached_data = load_csv_data()
+    _data_version += 1
+    _filter_cube.cache_clear()
+    _cached_filter_stats.cache_clear()
     return _cached_data
 
+def get_data_version():
+    """Token identifying the current dataset (bumped on every refresh)"""
+    return _data_version
+
 def get_filter_options(df):
     """Get filter options from dataframe - with debug logging"""
     try:
@@ -198,43 +315,72 @@ def get_dynamic_filter_options(df):
     """Alias for get_filter_options() - maintains compatibility"""
     return get_filter_options(df)
 
+def _slice_by_date(df, start_date, end_date):
+    """Narrow a date-sorted frame to the requested window via binary search
+
+    Returns (frame, True) when the window was applied - the frame is the
+    O(log N) searchsorted slice and the caller must not re-apply the date
+    predicates. Returns (df, False) when there is nothing to slice on or
+    the Date column is not sorted (e.g. rows with NaT dates), in which
+    case the caller falls back to full-column date masks.
+    """
+    if 'Date' not in df.columns or not (start_date or end_date):
+        return df, False
+    if not df['Date'].is_monotonic_increasing:
+        return df, False
+
+    dates = df['Date'].values
+    lo = np.searchsorted(dates, pd.to_datetime(start_date).to_datetime64(), 'left') if start_date else 0
+    hi = np.searchsorted(dates, pd.to_datetime(end_date).to_datetime64(), 'right') if end_date else len(df)
+    return df.iloc[lo:hi], True
+
+def _filter_masks(df, agency='all', cluster='all', site='all', start_date=None, end_date=None):
+    """Build one NumPy boolean array per active filter predicate
+
+    Shared by filter_data() and compute_filter_stats() so both apply the
+    same semantics. Returns an empty list when no filter is active.
+    """
+    masks = []
+
+    for column, value in (('agency', agency), ('cluster', cluster), ('site', site)):
+        if value and value != 'all' and column in df.columns:
+            masks.append((df[column] == value).values)
+
+    if 'Date' in df.columns and (start_date or end_date):
+        dates = df['Date'].values
+        if start_date:
+            masks.append(dates >= pd.to_datetime(start_date).to_datetime64())
+        if end_date:
+            masks.append(dates <= pd.to_datetime(end_date).to_datetime64())
+
+    return masks
+
 def filter_data(df, agency='all', cluster='all', site='all', start_date=None, end_date=None):
     """
     Apply filters to dataframe using your CSV columns directly
+
+    Each predicate is evaluated as a NumPy boolean array and the arrays
+    are fused with a single logical AND, so the frame is indexed exactly
+    once instead of materializing one intermediate copy per filter.
     """
     if df.empty:
         return df
-    
+
     try:
-        filtered_df = df.copy()
-        
-        # Apply agency filter using 'agency' column
-        if agency and agency != 'all' and 'agency' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['agency'] == agency]
-        
-        # Apply cluster filter using 'cluster' column
-        if cluster and cluster != 'all' and 'cluster' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['cluster'] == cluster]
-        
-        # Apply site filter using 'site' column
-        if site and site != 'all' and 'site' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['site'] == site]
-        
-        # Apply date filters
-        if 'Date' in filtered_df.columns:
-            if start_date:
-                if isinstance(start_date, str):
-                    start_date = pd.to_datetime(start_date)
-                filtered_df = filtered_df[pd.to_datetime(filtered_df['Date']) >= start_date]
-            
-            if end_date:
-                if isinstance(end_date, str):
-                    end_date = pd.to_datetime(end_date)
-                filtered_df = filtered_df[pd.to_datetime(filtered_df['Date']) <= end_date]
-        
-        logger.info(f"Filtered data: {len(filtered_df)} records from {len(df)} total")
+        working, dates_sliced = _slice_by_date(df, start_date, end_date)
+        if dates_sliced:
+            start_date = end_date = None
+
+        masks = _filter_masks(working, agency, cluster, site, start_date, end_date)
+
+        if not masks:
+            return working
+
+        filtered_df = working.loc[np.logical_and.reduce(masks)]
+
+        logger.info("Filtered data: %d records from %d total", len(filtered_df), len(df))
         return filtered_df
-        
+
     except Exception as e:
         logger.error(f"Error filtering data: {e}")
         return df
@@ -243,6 +389,133 @@ def apply_filters_to_data(df, agency='all', cluster='all', site='all', start_dat
     """Alias for filter_data() - maintains compatibility"""
     return filter_data(df, agency, cluster, site, start_date, end_date)
 
+def compute_filter_stats(df, agency='all', cluster='all', site='all', start_date=None, end_date=None):
+    """
+    Compute (record_count, total_weight, vehicle_count) in a single pass
+
+    The filter endpoint only needs three scalars, so there is no reason to
+    materialize an intermediate filtered DataFrame. Each active predicate
+    is evaluated as a NumPy boolean array, the arrays are fused with one
+    logical AND, and the aggregates read the masked columns directly.
+    """
+    if df.empty:
+        return 0, 0, 0
+
+    try:
+        df, dates_sliced = _slice_by_date(df, start_date, end_date)
+        if dates_sliced:
+            start_date = end_date = None
+
+        masks = _filter_masks(df, agency, cluster, site, start_date, end_date)
+
+        if masks:
+            mask = np.logical_and.reduce(masks)
+            record_count = int(np.count_nonzero(mask))
+        else:
+            mask = slice(None)
+            record_count = len(df)
+
+        # Column names differ between uploaded CSVs ('Net Weight' /
+        # 'Vehicle No') and the sample data ('weight' / 'vehicle')
+        weight_col = next((c for c in ('Net Weight', 'weight') if c in df.columns), None)
+        vehicle_col = next((c for c in ('Vehicle No', 'vehicle') if c in df.columns), None)
+
+        total_weight = 0
+        if weight_col and record_count:
+            # np.nansum matches pandas' NaN-skipping sum; a plain ndarray
+            # .sum() would poison the total with NaN from any bad row.
+            total_weight = float(np.nansum(df[weight_col].values[mask]))
+
+        vehicle_count = 0
+        if vehicle_col and record_count:
+            vehicle_count = int(pd.unique(df[vehicle_col].values[mask]).size)
+
+        return record_count, total_weight, vehicle_count
+
+    except Exception as e:
+        logger.error(f"Error computing filter stats: {e}")
+        return 0, 0, 0
+
+@functools.lru_cache(maxsize=1)
+def _filter_cube(data_version):
+    """Daily pre-aggregates answering filter queries without row scans
+
+    One (agency, cluster, site, day) cell per group, holding the row
+    count, the weight sum and the frozenset of vehicles seen - counts
+    and sums add across cells and vehicle sets union, so any filter
+    combination reduces to a pass over a few hundred cells instead of
+    every row. Returns None when the schema can't support it (missing
+    columns, NaT dates, or intraday timestamps whose day-bucketing
+    would change date-filter semantics); callers then fall back to the
+    row-level path.
+    """
+    df = get_cached_data()
+    try:
+        weight_col = next((c for c in ('Net Weight', 'weight') if c in df.columns), None)
+        vehicle_col = next((c for c in ('Vehicle No', 'vehicle') if c in df.columns), None)
+
+        if df.empty or weight_col is None or vehicle_col is None:
+            return None
+        if any(c not in df.columns for c in ('agency', 'cluster', 'site', 'Date')):
+            return None
+        if df['Date'].isna().any() or (df['Date'] != df['Date'].dt.normalize()).any():
+            return None
+
+        cube = df.groupby(
+            ['agency', 'cluster', 'site', 'Date'],
+            observed=True
+        ).agg(
+            n=(weight_col, 'size'),
+            w=(weight_col, 'sum'),
+            vehicles=(vehicle_col, frozenset)
+        ).reset_index()
+
+        logger.info(f"Built filter cube: {len(cube)} cells from {len(df)} rows")
+        return cube
+
+    except Exception as e:
+        logger.warning(f"Could not build filter cube, using row-level path: {e}")
+        return None
+
+def _stats_from_cube(cube, agency='all', cluster='all', site='all', start_date=None, end_date=None):
+    """Aggregate the selected cube cells into (count, weight, vehicles)"""
+    mask = np.ones(len(cube), dtype=bool)
+
+    for column, value in (('agency', agency), ('cluster', cluster), ('site', site)):
+        if value and value != 'all':
+            mask &= (cube[column] == value).values
+
+    if start_date:
+        mask &= cube['Date'].values >= pd.to_datetime(start_date).to_datetime64()
+    if end_date:
+        mask &= cube['Date'].values <= pd.to_datetime(end_date).to_datetime64()
+
+    selected = cube.loc[mask]
+    if selected.empty:
+        return 0, 0, 0
+
+    vehicle_count = len(frozenset().union(*selected['vehicles']))
+    return int(selected['n'].sum()), float(selected['w'].sum()), vehicle_count
+
+@functools.lru_cache(maxsize=1024)
+def _cached_filter_stats(data_version, agency, cluster, site, start_date, end_date):
+    """Memoized body of get_filter_stats, keyed on the data version
+
+    The dashboard re-requests the same small cartesian product of
+    dropdown values constantly while the CSV only changes on upload, so
+    repeat keys collapse to a dict lookup. data_version ties each entry
+    to the dataset it was computed from; refresh_cached_data() also
+    clears the cache outright so stale entries never accumulate.
+    """
+    cube = _filter_cube(data_version)
+    if cube is not None:
+        return _stats_from_cube(cube, agency, cluster, site, start_date, end_date)
+    return compute_filter_stats(get_cached_data(), agency, cluster, site, start_date, end_date)
+
+def get_filter_stats(agency='all', cluster='all', site='all', start_date=None, end_date=None):
+    """Filter statistics for the cached dataset, memoized per filter key"""
+    return _cached_filter_stats(_data_version, agency, cluster, site, start_date, end_date)
+
 def create_filtered_data_display(filtered_df, theme):
     """
     Create display component for filtered data - used by consolidated callbacks
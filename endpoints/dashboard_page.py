@@ -499,7 +499,7 @@ def create_dashboard_filter_content(theme_name="dark"):
                     '<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 1rem; margin-bottom: 1rem;">' +
                         '<div><strong>📅 Start:</strong> ' + startDate + '</div>' +
                         '<div><strong>📅 End:</strong> ' + endDate + '</div>' +
-                        '<div><strong>⚖️ Total Weight:</strong> ' + (data.total_weight || 'Calculating...') + '</div>' +
+                        '<div><strong>⚖️ Total Weight:</strong> ' + (data.total_weight_kg != null ? data.total_weight_kg.toLocaleString() + ' kg' : 'Calculating...') + '</div>' +
                         '<div><strong>🚛 Vehicles:</strong> ' + (data.vehicle_count || 'Counting...') + '</div>' +
                     '</div>' +
                     '<div style="margin-top: 1rem; padding: 1rem; background-color: rgba(56, 161, 105, 0.1); border-radius: 6px;">' +
@@ -4,13 +4,16 @@ Updated layout with specific card content and uniform sizing - ENHANCED VERSION
 Project Overview title added, followed by 1x4 header cards, agency header, then 2x4 main cards grid
 """
 
-from dash import html, dcc, callback, Input, Output
+from dash import html, dcc, callback, Input, Output, State, no_update
+import functools
+import hashlib
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
 import os
 import numpy as np
 from datetime import datetime, timedelta
+from config.themes import THEMES
 from utils.theme_utils import get_theme_styles, get_hover_overlay_css, get_theme_css_variables
 from components.navigation.hover_overlay import create_hover_overlay_banner  # ← IMPORT THE REAL ONE
 from utils.theme_utils import get_theme_styles
@@ -22,10 +25,19 @@ logger = logging.getLogger(__name__)
 # AGENCY NAMES MAPPING
 AGENCY_NAMES = {
     'Zigma': 'Zigma Global Enviro Solutions Private Limited, Erode',
-    'Saurashtra': 'Saurastra Enviro Pvt Ltd, Gujarat', 
+    'Saurashtra': 'Saurastra Enviro Pvt Ltd, Gujarat',
     'Tharuni': 'Tharuni Associates, Guntur'
 }
 
+# Performance color ramp - one searchsorted lookup instead of a 4-way if-elif chain
+_PERFORMANCE_THRESHOLDS = np.array([0.5, 0.8, 1.0])
+_PERFORMANCE_COLORS = (
+    "var(--error, #E53E3E)",    # Red - Critical performance
+    "var(--warning, #DD6B20)",  # Orange - Behind target
+    "var(--info, #3182CE)",     # Blue - Close to target
+    "var(--success, #38A169)",  # Green - Meeting or exceeding target
+)
+
 def get_display_agency_name(agency_key):
     """Get the full display name for an agency"""
     if not agency_key:
@@ -45,40 +57,114 @@ def get_display_agency_name(agency_key):
     logger.warning(f"⚠️ No agency mapping found for: '{agency_key}'")
     return f"{agency_key} (Unmapped)"
 
+# Parsed-data cache: interval ticks skip the re-parse and the version only
+# bumps when the CSV actually changes, so downstream caches stay warm
+_DATA_CACHE = {'key': None, 'df': None, 'version': 0, 'fingerprint': None}
+
+
+def get_data_version():
+    """Monotonic version of the loaded dataset - bumps only when the content changes"""
+    return _DATA_CACHE['version']
+
+
+def _frame_fingerprint(df):
+    """Content hash of a frame, independent of object identity"""
+    try:
+        return hash(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    except Exception as e:
+        logger.debug(f"Could not fingerprint frame: {e}")
+        return None
+
+
+def _store_loaded_data(key, df):
+    """Record a freshly parsed frame; the version bumps only if the content differs"""
+    _DATA_CACHE['key'] = key
+    fingerprint = _frame_fingerprint(df)
+    if fingerprint is None or fingerprint != _DATA_CACHE['fingerprint']:
+        # A touched-but-identical CSV keeps the version (and all caches) warm
+        _DATA_CACHE['df'] = df
+        _DATA_CACHE['fingerprint'] = fingerprint
+        _DATA_CACHE['version'] += 1
+    return _DATA_CACHE['df']
+
+
+# On-disk cache of the parsed frame, keyed on source mtime+size: process
+# restarts reload from Parquet instead of re-parsing the CSV
+_PARQUET_CACHE_DIR = '/tmp/haritha_cache'
+
+
+def _parquet_cache_path(cache_key):
+    # blake2s, not hash(): str hashing is salted per interpreter, so a
+    # built-in hash of the (path, mtime, size) key would never match
+    # after a restart - exactly the case this cache exists for
+    digest = hashlib.blake2s(repr(cache_key).encode()).hexdigest()
+    return os.path.join(_PARQUET_CACHE_DIR, f"agency_{digest}.parquet")
+
+
 def load_agency_data():
     """Load data from CSV with agency configuration logging"""
     try:
         csv_path = 'data/public_mini_processed_dates_fixed.csv'
         if os.path.exists(csv_path):
-            df = pd.read_csv(csv_path)
-            logger.info(f"✅ Loaded {len(df)} records from agency data")
-            
-            # Convert date columns to datetime if needed
-            date_columns = ['start_date', 'planned_end_date', 'expected_end_date']
-            for col in date_columns:
-                if col in df.columns:
-                    df[col] = pd.to_datetime(df[col], errors='coerce')
-            
-            # Clean column names
-            df.columns = df.columns.str.strip()
-            
-            # Log agency mappings
-            if 'Agency' in df.columns:
-                unique_agencies = df['Agency'].dropna().unique()
-                logger.info(f"📋 Found {len(unique_agencies)} agencies in data:")
-                
-                for agency in unique_agencies:
-                    display_name = get_display_agency_name(agency)
-                    if "(Unmapped)" in display_name:
-                        status = "⚠️ UNMAPPED"
-                    else:
-                        status = "✅ MAPPED"
-                    logger.info(f"  {status}: '{agency}' → '{display_name}'")
-            
-            return df
+            stat = os.stat(csv_path)
+            cache_key = (csv_path, stat.st_mtime, stat.st_size)
+            if _DATA_CACHE['key'] == cache_key:
+                return _DATA_CACHE['df']
+
+            # Warm start: reuse the already-processed Parquet copy if present
+            parquet_path = _parquet_cache_path(cache_key)
+            df = None
+            if os.path.exists(parquet_path):
+                try:
+                    df = pd.read_parquet(parquet_path)
+                    logger.info("✅ Loaded %s records from parquet cache", len(df))
+                except Exception as parquet_error:
+                    logger.warning(f"⚠️ Could not read parquet cache: {parquet_error}")
+                    df = None
+
+            if df is None:
+                df = pd.read_csv(csv_path)
+                logger.info(f"✅ Loaded {len(df)} records from agency data")
+
+                # Convert date columns to datetime if needed
+                date_columns = ['start_date', 'planned_end_date', 'expected_end_date']
+                for col in date_columns:
+                    if col in df.columns:
+                        df[col] = pd.to_datetime(df[col], errors='coerce')
+
+                # Clean column names
+                df.columns = df.columns.str.strip()
+
+                # Log agency mappings
+                if 'Agency' in df.columns:
+                    unique_agencies = df['Agency'].dropna().unique()
+                    logger.info(f"📋 Found {len(unique_agencies)} agencies in data:")
+
+                    for agency in unique_agencies:
+                        display_name = get_display_agency_name(agency)
+                        if "(Unmapped)" in display_name:
+                            status = "⚠️ UNMAPPED"
+                        else:
+                            status = "✅ MAPPED"
+                        logger.info(f"  {status}: '{agency}' → '{display_name}'")
+
+                # Persist processed frame for the next process start
+                # (write-to-temp + atomic rename so concurrent workers never
+                # see a half-written file)
+                try:
+                    os.makedirs(_PARQUET_CACHE_DIR, exist_ok=True)
+                    tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
+                    df.to_parquet(tmp_path, compression='zstd')
+                    os.replace(tmp_path, parquet_path)
+                except Exception as parquet_error:
+                    logger.warning(f"⚠️ Could not write parquet cache: {parquet_error}")
+
+            return _store_loaded_data(cache_key, df)
         else:
             logger.warning(f"📄 CSV file not found at {csv_path}, creating sample data")
-            return create_sample_agency_data()
+            if _DATA_CACHE['key'] != 'sample':
+                _store_loaded_data('sample', create_sample_agency_data())
+            return _DATA_CACHE['df']
     except Exception as e:
         logger.error(f"❌ Error loading agency data: {e}")
         return create_sample_agency_data()
@@ -123,7 +209,6 @@ def create_sample_agency_data():
 def calculate_cluster_completion_rates(agency_data):
     """Calculate completion rate for each cluster in the agency"""
     cluster_rates = []
-    print("@@@@@@@@@@@@@@@@@@",agency_data.columns)
     if agency_data.empty or 'Cluster' not in agency_data.columns:
         return cluster_rates
     
@@ -162,9 +247,10 @@ def calculate_cluster_completion_rates(agency_data):
         # Sort by completion rate (highest first)
         cluster_rates.sort(key=lambda x: x['completion_rate'], reverse=True)
         
-        logger.info(f"📊 Calculated completion rates for {len(cluster_rates)} clusters")
-        for cluster in cluster_rates:
-            logger.info(f"  {cluster['cluster']}: {cluster['completion_rate']}% ({cluster['total_remediated']}/{cluster['total_to_remediate']} MT)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📊 Calculated completion rates for %s clusters", len(cluster_rates))
+            for cluster in cluster_rates:
+                logger.info("  %s: %s%% (%s/%s MT)", cluster['cluster'], cluster['completion_rate'], cluster['total_remediated'], cluster['total_to_remediate'])
         
     except Exception as e:
         logger.error(f"❌ Error calculating cluster completion rates: {e}")
@@ -291,9 +377,10 @@ def calculate_site_completion_rates(agency_data):
         # Sort by completion rate (highest first) - DESCENDING ORDER
         site_rates.sort(key=lambda x: x['completion_rate'], reverse=True)
         
-        logger.info(f"📊 Calculated completion rates for {len(site_rates)} sites")
-        for site in site_rates[:5]:  # Log top 5 for debugging
-            logger.info(f"  {site['site']} ({site['cluster']}): {site['completion_rate']}% ({site['total_remediated']}/{site['total_to_remediate']} MT)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📊 Calculated completion rates for %s sites", len(site_rates))
+            for site in site_rates[:5]:  # Log top 5 for debugging
+                logger.info("  %s (%s): %s%% (%s/%s MT)", site['site'], site['cluster'], site['completion_rate'], site['total_remediated'], site['total_to_remediate'])
         
     except Exception as e:
         logger.error(f"❌ Error calculating site completion rates: {e}")
@@ -589,9 +676,10 @@ def calculate_lagging_sites(agency_data):
         # Sort by days_overdue (most critical first - highest overdue days)
         lagging_sites.sort(key=lambda x: x['days_overdue'], reverse=True)
         
-        logger.info(f"🚨 Found {len(lagging_sites)} lagging sites (cannot complete before Sept 30, 2025)")
-        for site in lagging_sites[:3]:  # Log top 3 for debugging
-            logger.info(f"  {site['site']} ({site['cluster']}): needs {site['days_required']} days, only {site['days_until_sept30']} available (overdue by {site['days_overdue']} days)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🚨 Found %s lagging sites (cannot complete before Sept 30, 2025)", len(lagging_sites))
+            for site in lagging_sites[:3]:  # Log top 3 for debugging
+                logger.info("  %s (%s): needs %s days, only %s available (overdue by %s days)", site['site'], site['cluster'], site['days_required'], site['days_until_sept30'], site['days_overdue'])
         
     except Exception as e:
         logger.error(f"❌ Error calculating lagging sites: {e}")
@@ -845,10 +933,11 @@ def calculate_performance_rankings(agency_data):
         # Sort by composite score (highest first - best performers)
         performance_sites.sort(key=lambda x: x['composite_score'], reverse=True)
         
-        logger.info(f"🏆 Calculated performance rankings for {len(performance_sites)} sites")
-        for i, site in enumerate(performance_sites[:3]):  # Log top 3 for debugging
-            rank = i + 1
-            logger.info(f"  #{rank}: {site['site']} ({site['cluster']}) - Score: {site['composite_score']}, Completion: {site['completion_rate']}%, Timeline: {site['days_ahead_behind']}d")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🏆 Calculated performance rankings for %s sites", len(performance_sites))
+            for i, site in enumerate(performance_sites[:3]):  # Log top 3 for debugging
+                rank = i + 1
+                logger.info("  #%s: %s (%s) - Score: %s, Completion: %s%%, Timeline: %sd", rank, site['site'], site['cluster'], site['composite_score'], site['completion_rate'], site['days_ahead_behind'])
         
     except Exception as e:
         logger.error(f"❌ Error calculating performance rankings: {e}")
@@ -1712,6 +1801,27 @@ def create_header_card_1(current_agency_display=None, agency_data=None, all_agen
         completion_percentage=completion_rate    # ADD completion percentage
     )
 
+# Shared count-badge style; only the background color varies per card
+_BADGE_STYLE = {
+    "color": "white",
+    "fontSize": "clamp(0.9rem, 1.8vh, 1.2rem)",
+    "fontWeight": "700",
+    "textShadow": "0 1px 2px rgba(0, 0, 0, 0.5)",
+    "padding": "0.15rem 0.4rem",
+    "borderRadius": "10px",
+    "marginLeft": "0.5rem"
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _badge(count, label, background="var(--info, #3182CE)"):
+    """Cached count badge - the same (count, label) pair repeats across interval ticks"""
+    return html.Span(
+        f"{count} {label}",
+        style={**_BADGE_STYLE, "background": background, "border": f"1px solid {background}"}
+    )
+
+
 def create_header_card_2(current_agency_display=None, agency_data=None, all_agencies_data=None):
     """Create Header Card 2: Active & Inactive Sites Count"""
     
@@ -1736,22 +1846,7 @@ def create_header_card_2(current_agency_display=None, agency_data=None, all_agen
     title_children = [html.H3("Site Status", className="card-title")]
     
     if total_sites > 0:
-        title_children.append(
-            html.Span(
-                f"{total_sites} Sites",
-                style={
-                    "color": "white",
-                    "fontSize": "clamp(0.9rem, 1.8vh, 1.2rem)",
-                    "fontWeight": "700",
-                    "textShadow": "0 1px 2px rgba(0, 0, 0, 0.5)",
-                    "background": "#38A169",  # Blue background
-                    "padding": "0.15rem 0.4rem",
-                    "borderRadius": "10px",
-                    "border": "1px solid #38A169",
-                    "marginLeft": "0.5rem"
-                }
-            )
-        )
+        title_children.append(_badge(total_sites, "Sites", background="#38A169"))
     
     return html.Div(
         className="enhanced-metric-card header-card-2",
@@ -1834,7 +1929,7 @@ def create_header_card_3(current_agency_display=None, agency_data=None, all_agen
             if 'Quantity remediated today' in all_agencies_data.columns:
                 # Sum today's actual processing across all agencies
                 current_daily_rate = all_agencies_data['Quantity remediated today'].fillna(0).sum()
-                logger.info(f"📊 Today's actual processing: {current_daily_rate} MT across all agencies")
+                logger.info("📊 Today's actual processing: %s MT across all agencies", current_daily_rate)
             else:
                 logger.warning("⚠️ 'Quantity remediated today' column not found, using fallback calculation")
                 # Fallback: use Daily_Capacity if available
@@ -1856,10 +1951,10 @@ def create_header_card_3(current_agency_display=None, agency_data=None, all_agen
                 
                 if days_remaining > 0:
                     required_daily_rate = remaining_quantity / days_remaining
-                    logger.info(f"📈 Required daily rate: {required_daily_rate} MT/day ({remaining_quantity} MT remaining ÷ {days_remaining} days)")
+                    logger.info("📈 Required daily rate: %s MT/day (%s MT remaining ÷ %s days)", required_daily_rate, remaining_quantity, days_remaining)
                 else:
                     required_daily_rate = remaining_quantity
-                    logger.warning(f"⚠️ Deadline passed! Remaining quantity: {remaining_quantity} MT")
+                    logger.warning("⚠️ Deadline passed! Remaining quantity: %s MT", remaining_quantity)
             else:
                 logger.warning("⚠️ Missing columns for required rate calculation")
                 required_daily_rate = 0
@@ -1868,8 +1963,8 @@ def create_header_card_3(current_agency_display=None, agency_data=None, all_agen
             current_daily_rate = round(current_daily_rate, 1)
             required_daily_rate = round(required_daily_rate, 1)
             
-            # Log performance comparison
-            if required_daily_rate > 0:
+            # Log performance comparison (only format when INFO is actually emitted)
+            if required_daily_rate > 0 and logger.isEnabledFor(logging.INFO):
                 performance_ratio = (current_daily_rate / required_daily_rate) * 100
                 if performance_ratio >= 100:
                     status = f"✅ AHEAD - {performance_ratio:.1f}% of target"
@@ -1879,8 +1974,8 @@ def create_header_card_3(current_agency_display=None, agency_data=None, all_agen
                     status = f"⚠️ BEHIND - {performance_ratio:.1f}% of target"
                 else:
                     status = f"🚨 CRITICAL - {performance_ratio:.1f}% of target"
-                logger.info(f"🎯 Daily Performance: {status}")
-            
+                logger.info("🎯 Daily Performance: %s", status)
+
         except Exception as e:
             logger.error(f"❌ Error calculating daily rates: {e}")
             current_daily_rate = 0
@@ -1947,18 +2042,10 @@ def create_header_card_3(current_agency_display=None, agency_data=None, all_agen
     def get_performance_colors(current, required):
         if required <= 0:
             return "var(--info, #3182CE)", "var(--info, #3182CE)"
-        
-        performance_ratio = current / required
-        
-        if performance_ratio >= 1.0:
-            current_color = "var(--success, #38A169)"  # Green - Meeting or exceeding target
-        elif performance_ratio >= 0.8:
-            current_color = "var(--info, #3182CE)"     # Blue - Close to target
-        elif performance_ratio >= 0.5:
-            current_color = "var(--warning, #DD6B20)"  # Orange - Behind target
-        else:
-            current_color = "var(--error, #E53E3E)"    # Red - Critical performance
-        
+
+        # Table lookup on the performance ratio replaces the 4-way branch
+        current_color = _PERFORMANCE_COLORS[int(np.searchsorted(_PERFORMANCE_THRESHOLDS, current / required, side='right'))]
+
         # Required rate color based on urgency
         if days_remaining <= 30:
             required_color = "var(--error, #E53E3E)"   # Red - Very urgent
@@ -1984,21 +2071,71 @@ def create_header_card_3(current_agency_display=None, agency_data=None, all_agen
     )
 
 
+# Usage-tracking cache for the header grid: the key is built from the handful
+# of aggregates the four cards actually read, not from frame identity, so a
+# fresh DataFrame with the same totals still hits
+_HEADER_GRID_CACHE = {}
+_HEADER_GRID_CACHE_MAX = len(AGENCY_NAMES) * 4
+
+
+def _header_grid_usage_key(all_agencies_data):
+    """Tuple of the project-wide aggregates consumed by header cards 1-4"""
+    if all_agencies_data is None or all_agencies_data.empty:
+        return None
+
+    def col_sum(col):
+        if col not in all_agencies_data.columns:
+            return 0.0
+        # Coerce - some CSV columns (e.g. Daily_Capacity) arrive as strings
+        return float(pd.to_numeric(all_agencies_data[col], errors='coerce').fillna(0).sum())
+
+    if 'Active_site' in all_agencies_data.columns:
+        active_sites = int((all_agencies_data['Active_site'].str.lower() == 'yes').sum())
+    else:
+        active_sites = 0
+
+    return (
+        len(all_agencies_data),
+        col_sum('Cumulative Quantity remediated till date in MT'),  # cards 1 & 3
+        col_sum('Quantity to be remediated in MT'),                 # cards 1 & 3
+        col_sum('Quantity remediated today'),                       # card 3
+        col_sum('Daily_Capacity'),                                  # card 3 fallback
+        active_sites,                                               # card 2
+        _machine_deployment_counts(all_agencies_data)               # card 4
+    )
+
+
 def create_header_cards_grid(current_agency_display=None, agency_data=None, all_agencies_data=None):
     """Create the 1x4 header cards grid with individual card functions"""
-    
+
+    usage_key = _header_grid_usage_key(all_agencies_data)
+    cache_key = None
+    if usage_key is not None:
+        # Today's date matters because card 3 derives days-remaining from it
+        cache_key = (current_agency_display, usage_key, datetime.now().date())
+        cached = _HEADER_GRID_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
     header_cards = [
         create_header_card_1(current_agency_display, agency_data, all_agencies_data),
         create_header_card_2(current_agency_display, agency_data, all_agencies_data),
         create_header_card_3(current_agency_display, agency_data, all_agencies_data),
         create_header_card_4(current_agency_display, agency_data, all_agencies_data)
     ]
-    
-    return html.Div(
+
+    grid = html.Div(
         className="header-cards-grid",
         children=header_cards
     )
 
+    if cache_key is not None:
+        if len(_HEADER_GRID_CACHE) >= _HEADER_GRID_CACHE_MAX:
+            _HEADER_GRID_CACHE.pop(next(iter(_HEADER_GRID_CACHE)))
+        _HEADER_GRID_CACHE[cache_key] = grid
+
+    return grid
+
 # Legacy function for backwards compatibility (you can remove this later)
 def create_header_card(card_number, icon="📊", title=None, content="Coming Soon"):
     """Legacy function - use individual card functions instead"""
@@ -2038,119 +2175,93 @@ def get_progress_color(percentage):
         return "#F56565"  # Red
 
 
+def _count_machine_tokens(machine_values):
+    """Count non-empty comma-separated machine tokens in a raw value array"""
+    total_machines = 0
+
+    for machine_value in machine_values:
+        # Skip if machine value is null or empty
+        if pd.isna(machine_value):
+            continue
+
+        machine_str = str(machine_value).strip()
+        if machine_str == '':
+            continue
+
+        # Split by comma and count each machine
+        total_machines += sum(1 for m in machine_str.split(',') if m.strip())
+
+    return total_machines
+
+
 def count_machines_from_data(data, only_active=False):
     """
     Count machines from the Machine column, handling comma-separated values
-    
+
     Args:
         data: DataFrame with Machine column
         only_active: If True, only count machines from active sites
-    
+
     Returns:
         int: Total count of machines
     """
     if data is None or data.empty or 'Machine' not in data.columns:
         return 0
-    
-    # Filter for active sites if requested
-    working_data = data.copy()
+
+    # Work on the raw value array - no df.copy() / iterrows() on the hot path
+    machine_values = data['Machine'].values
     if only_active and 'Active_site' in data.columns:
-        working_data = data[data['Active_site'].str.lower() == 'yes']
-    
-    if working_data.empty:
+        machine_values = machine_values[(data['Active_site'].str.lower() == 'yes').values]
+
+    if machine_values.size == 0:
         return 0
-    
-    total_machines = 0
-    
+
     try:
-        for _, row in working_data.iterrows():
-            machine_value = row['Machine']
-            
-            # Skip if machine value is null or empty
-            if pd.isna(machine_value) or str(machine_value).strip() == '':
-                continue
-            
-            # Convert to string and split by comma
-            machine_str = str(machine_value).strip()
-            
-            # Split by comma and count each machine
-            machines = [m.strip() for m in machine_str.split(',') if m.strip()]
-            total_machines += len(machines)
-            
+        return _count_machine_tokens(machine_values)
     except Exception as e:
         print(f"⚠️ Error counting machines: {e}")
         return 0
-    
-    return total_machines
 
 
-def create_header_card_4(current_agency_display=None, agency_data=None, all_agencies_data=None):
-    """Create Header Card 4: Overall Machine Status - Deployed vs Planned"""
+def _machine_deployment_counts(data):
+    """Compute (planned, deployed, not_deployed) machine counts with explicit guards"""
+    if data is None or data.empty or 'Machine' not in data.columns:
+        return 0, 0, 0
 
-    # Calculate overall machine deployment metrics
-    planned_machines = 0
-    deployed_machines = 0
+    # Count planned machines (all records) and deployed machines (active sites only)
+    planned = count_machines_from_data(data)
+    deployed = count_machines_from_data(data, only_active=True)
+    return planned, deployed, abs(planned - deployed)
 
-    # Calculate based on all_agencies_data
-    if all_agencies_data is not None and not all_agencies_data.empty:
-        try:
-            # Count total planned machines across all agencies (all records)
-            planned_machines = count_machines_from_data(all_agencies_data)
-            
-            # Count deployed machines across all agencies (only active sites)
-            deployed_machines = count_machines_from_data(all_agencies_data, only_active=True)
-            
-            not_deployed_machines = abs(planned_machines - deployed_machines)
-                
-            print(f"🚀 Overall Machine Status: {deployed_machines} deployed out of {planned_machines} planned")
-                
-        except Exception as e:
-            print(f"⚠️ Error calculating overall machine status: {e}")
-            planned_machines = 0
-            deployed_machines = 0
 
-    # Calculate deployment percentage ← ADD THIS
-    deployment_percentage = 0
-    if planned_machines > 0:
-        deployment_percentage = round((deployed_machines / planned_machines) * 100, 1)
+def _machine_status_card(icon, card_class, planned, deployed, not_deployed, show_badge):
+    """Shared machine-status card body - Deployed vs Not deployed with optional count badge"""
+
+    # Only build the badge when there is something to show - no empty-string child to serialize
+    title_children = [html.H3("Machine Status", className="card-title")]
+    if show_badge:
+        title_children.append(_badge(planned, "Machines"))
 
-    # Use the dual metric card format but with machine count badge ← MODIFY THIS
     return html.Div(
-        className="enhanced-metric-card header-card-4",
+        className=f"enhanced-metric-card {card_class}",
         children=[
-            # Card Header with machine count badge ← ADD THIS SECTION
+            # Card Header with machine count badge
             html.Div(
                 className="card-header",
                 children=[
-                    html.Div("🚀", className="card-icon"),
+                    html.Div(icon, className="card-icon"),
                     html.Div(
                         style={
                             "display": "flex",
                             "alignItems": "center",
                             "flex": "1"
                         },
-                        children=[
-                            html.H3("Machine Status", className="card-title"),
-                            html.Span(
-                                f"{planned_machines} Machines",
-                                style={
-                                    "color": "white",
-                                    "fontSize": "clamp(0.9rem, 1.8vh, 1.2rem)",
-                                    "fontWeight": "700",
-                                    "textShadow": "0 1px 2px rgba(0, 0, 0, 0.5)",
-                                    "background": "var(--info, #3182CE)",  # Blue for total count
-                                    "padding": "0.15rem 0.4rem",
-                                    "borderRadius": "10px",
-                                    "border": "1px solid var(--info, #3182CE)",
-                                    "marginLeft": "0.5rem"
-                                }
-                            ) if planned_machines > 0 else ""
-                        ]
+                        children=title_children
                     )
                 ]
             ),
-            
-            # Metrics Container ← KEEP EXISTING
+
+            # Metrics Container
             html.Div(
                 className="metrics-container",
                 children=[
@@ -2159,7 +2270,7 @@ def create_header_card_4(current_agency_display=None, agency_data=None, all_agen
                         className="metric-display primary",
                         children=[
                             html.Div(
-                                str(deployed_machines),
+                                str(deployed),
                                 className="metric-number",
                                 style={"color": "var(--success, #38A169)"}  # Green for deployed machines
                             ),
@@ -2169,16 +2280,16 @@ def create_header_card_4(current_agency_display=None, agency_data=None, all_agen
                             )
                         ]
                     ),
-                    
+
                     # Visual Separator
                     html.Div(className="metrics-separator"),
-                    
+
                     # Second metric
                     html.Div(
                         className="metric-display secondary",
                         children=[
                             html.Div(
-                                str(not_deployed_machines),
+                                str(not_deployed),
                                 className="metric-number",
                                 style={"color": "var(--info, #3182CE)"}     # Blue for planned machines
                             ),
@@ -2194,114 +2305,49 @@ def create_header_card_4(current_agency_display=None, agency_data=None, all_agen
     )
 
 
+def create_header_card_4(current_agency_display=None, agency_data=None, all_agencies_data=None):
+    """Create Header Card 4: Overall Machine Status - Deployed vs Planned"""
+    # Calculate overall machine deployment metrics across all agencies
+    planned, deployed, not_deployed = _machine_deployment_counts(all_agencies_data)
+    return _machine_status_card("🚀", "header-card-4", planned, deployed, not_deployed, show_badge=planned > 0)
+
+
 def create_agency_completion_card(agency_data=None):
     """Create Card 4: Agency Machine Status - Deployed vs Planned (agency-specific)"""
+    # Calculate agency machine deployment metrics (current agency only)
+    planned, deployed, not_deployed = _machine_deployment_counts(agency_data)
+    return _machine_status_card("🏗️", "agency-machine-card", planned, deployed, not_deployed, show_badge=not_deployed > 0)
 
-    # Calculate agency machine deployment metrics
-    agency_planned_machines = 0
-    agency_deployed_machines = 0
 
-    # Calculate based on agency_data (current agency only)
-    if agency_data is not None and not agency_data.empty:
-        try:
-            # Count total planned machines for current agency (all records)
-            agency_planned_machines = count_machines_from_data(agency_data, only_active=False)
-            # Count deployed machines for current agency (only active sites)
-            agency_deployed_machines = count_machines_from_data(agency_data, only_active=True)
-            agency_not_deployed_machines = abs(agency_planned_machines - agency_deployed_machines)
-                
-            print(f"🏢 Agency Machine Status: {agency_deployed_machines} deployed out of {agency_planned_machines} planned")
-                
-        except Exception as e:
-            print(f"⚠️ Error calculating agency machine status: {e}")
-            agency_planned_machines = 0
-            agency_deployed_machines = 0
+def _agency_data_fingerprint(agency_data):
+    """Hash the frame contents so unchanged data can skip the full card rebuild"""
+    if agency_data is None or agency_data.empty:
+        return None
+    try:
+        return hashlib.blake2b(pd.util.hash_pandas_object(agency_data, index=False).values.tobytes()).digest()
+    except Exception as e:
+        logger.debug(f"Could not fingerprint agency data: {e}")
+        return None
 
 
-    # Use dual metric card format with machine count badge ← MODIFY THIS
-    return html.Div(
-        className="enhanced-metric-card agency-machine-card",
-        children=[
-            # Card Header with machine count badge ← ADD THIS SECTION
-            html.Div(
-                className="card-header",
-                children=[
-                    html.Div("🏗️", className="card-icon"),
-                    html.Div(
-                        style={
-                            "display": "flex",
-                            "alignItems": "center",
-                            "flex": "1"
-                        },
-                        children=[
-                            html.H3("Machine Status", className="card-title"),
-                            html.Span(
-                                f"{agency_planned_machines} Machines",
-                                style={
-                                    "color": "white",
-                                    "fontSize": "clamp(0.9rem, 1.8vh, 1.2rem)",
-                                    "fontWeight": "700",
-                                    "textShadow": "0 1px 2px rgba(0, 0, 0, 0.5)",
-                                    "background": "var(--info, #3182CE)",  # Blue for total count
-                                    "padding": "0.15rem 0.4rem",
-                                    "borderRadius": "10px",
-                                    "border": "1px solid var(--info, #3182CE)",
-                                    "marginLeft": "0.5rem"
-                                }
-                            ) if agency_not_deployed_machines > 0 else ""
-                        ]
-                    )
-                ]
-            ),
-            
-            # Metrics Container ← KEEP EXISTING
-            html.Div(
-                className="metrics-container",
-                children=[
-                    # First metric
-                    html.Div(
-                        className="metric-display primary",
-                        children=[
-                            html.Div(
-                                str(agency_deployed_machines),
-                                className="metric-number",
-                                style={"color": "var(--success, #38A169)"}  # Green for deployed machines
-                            ),
-                            html.Div(
-                                "Deployed",
-                                className="metric-label"
-                            )
-                        ]
-                    ),
-                    
-                    # Visual Separator
-                    html.Div(className="metrics-separator"),
-                    
-                    # Second metric
-                    html.Div(
-                        className="metric-display secondary",
-                        children=[
-                            html.Div(
-                                str(agency_not_deployed_machines),
-                                className="metric-number",
-                                style={"color": "var(--info, #3182CE)"}     # Blue for planned machines
-                            ),
-                            html.Div(
-                                "Not deployed",
-                                className="metric-label"
-                            )
-                        ]
-                    )
-                ]
-            )
-        ]
-    )
+# Last-invocation cache: interval ticks often re-render identical data
+_last_cards_key = None
+_last_cards = None
 
 
 def create_specific_metric_cards(current_agency_display, metrics, theme_styles, agency_data=None):
     """Create all 8 cards in 2x4 grid with enhanced Card 1 showing agency completion percentage"""
-    cards = []
-    
+    global _last_cards_key, _last_cards
+
+    # Short-circuit when the same data/theme/agency was rendered last time
+    # (include today's date since the daily performance card depends on it)
+    data_hash = _agency_data_fingerprint(agency_data)
+    cards_key = None
+    if data_hash is not None:
+        cards_key = (data_hash, current_agency_display, metrics, theme_styles, datetime.now().date())
+        if cards_key == _last_cards_key and _last_cards is not None:
+            return _last_cards
+
     # Card 1: Agency Quantity Metrics (Remediated vs Required) WITH COMPLETION PERCENTAGE
     # Calculate agency-specific quantity metrics
     agency_total_remediated = 0
@@ -2318,10 +2364,8 @@ def create_specific_metric_cards(current_agency_display, metrics, theme_styles,
             agency_total_to_remediate = agency_data['Quantity to be remediated in MT'].sum()
             agency_total_to_remediate = int(round(agency_total_to_remediate, 0))
     
-    # Calculate agency completion percentage
-    agency_completion_rate = 0
-    if agency_total_to_remediate > 0:
-        agency_completion_rate = round((agency_total_remediated / agency_total_to_remediate) * 100, 1)
+    # Calculate agency completion percentage (branchless ternary form)
+    agency_completion_rate = round((agency_total_remediated / agency_total_to_remediate) * 100, 1) if agency_total_to_remediate > 0 else 0
     
     # Format numbers in Indian format (XX,XX,XXX) - same as header card 1
     def format_indian_number(num):
@@ -2374,10 +2418,12 @@ def create_specific_metric_cards(current_agency_display, metrics, theme_styles,
         metric2_color="var(--info, #3182CE)",    # Blue for total work
         completion_percentage=agency_completion_rate  # ADD agency completion percentage
     )
-    cards.append(card1)
-    
+
     # Card 2: Active Sites (green) and Inactive Sites (red)
-    agency_total_sites = metrics['active_sites'] + metrics['inactive_sites'] 
+    agency_total_sites = metrics['active_sites'] + metrics['inactive_sites']
+    card2_title_children = [html.H3("Site Status", className="card-title")]
+    if agency_total_sites > 0:
+        card2_title_children.append(_badge(agency_total_sites, "Sites", background="#38A169"))
     card2 = html.Div(
         className="enhanced-metric-card",
         children=[
@@ -2392,23 +2438,7 @@ def create_specific_metric_cards(current_agency_display, metrics, theme_styles,
                             "alignItems": "center",
                             "flex": "1"
                         },
-                        children=[
-                            html.H3("Site Status", className="card-title"),
-                            html.Span(
-                                f"{agency_total_sites} Sites",
-                                style={
-                                    "color": "white",
-                                    "fontSize": "clamp(0.9rem, 1.8vh, 1.2rem)",
-                                    "fontWeight": "700",
-                                    "textShadow": "0 1px 2px rgba(0, 0, 0, 0.5)",
-                                    "background": "#38A169",
-                                    "padding": "0.15rem 0.4rem",
-                                    "borderRadius": "10px",
-                                    "border": "1px solid #38A169",
-                                    "marginLeft": "0.5rem"
-                                }
-                            ) if agency_total_sites > 0 else ""
-                        ]
+                        children=card2_title_children
                     )
                 ]
             ),
@@ -2455,44 +2485,31 @@ def create_specific_metric_cards(current_agency_display, metrics, theme_styles,
             )
         ]
     )
-    cards.append(card2)
-    
-    # Card 3: ENHANCED - Agency Daily Performance (same logic as header card 3 but agency-specific)
-    card3 = create_agency_daily_performance_card(current_agency_display, agency_data)
-    cards.append(card3)
-    
-    # Card 4: ENHANCED - Agency Completion Percentage (similar to header card 4)
-    card4 = create_agency_completion_card(agency_data)
-    cards.append(card4)
-    
-    # Card 5: Cluster Progress (LIST STYLE) - UNCHANGED
-    if agency_data is not None and not agency_data.empty:
-        card5 = create_cluster_progress_card(current_agency_display, agency_data)
-    else:
-        card5 = create_empty_card(5)
-    cards.append(card5)
 
-    # Card 6: Lagging Sites (LIST STYLE) - MOVED FROM POSITION 7
-    if agency_data is not None and not agency_data.empty:
-        card6 = create_lagging_sites_card(current_agency_display, agency_data)
-    else:
-        card6 = create_empty_card(6)
-    cards.append(card6)
+    has_agency_data = agency_data is not None and not agency_data.empty
 
+    # Single list literal - avoids eight append calls and list regrowth:
+    # Card 3: Agency Daily Performance (same logic as header card 3 but agency-specific)
+    # Card 4: Agency Completion Percentage (similar to header card 4)
+    # Card 5: Cluster Progress (LIST STYLE)
+    # Card 6: Lagging Sites (LIST STYLE) - MOVED FROM POSITION 7
     # Card 7: Performance Rankings - MOVED FROM POSITION 8
-    if agency_data is not None and not agency_data.empty:
-        card7 = create_performance_rankings_card(current_agency_display, agency_data)
-    else:
-        card7 = create_empty_card(7)
-    cards.append(card7)
-
     # Card 8: Site Progress (LIST STYLE) - MOVED FROM POSITION 6
-    if agency_data is not None and not agency_data.empty:
-        card8 = overall_breakdown(current_agency_display, agency_data)
-    else:
-        card8 = create_empty_card(8)
-    cards.append(card8)
-    
+    cards = [
+        card1,
+        card2,
+        create_agency_daily_performance_card(current_agency_display, agency_data),
+        create_agency_completion_card(agency_data),
+        create_cluster_progress_card(current_agency_display, agency_data) if has_agency_data else create_empty_card(5),
+        create_lagging_sites_card(current_agency_display, agency_data) if has_agency_data else create_empty_card(6),
+        create_performance_rankings_card(current_agency_display, agency_data) if has_agency_data else create_empty_card(7),
+        overall_breakdown(current_agency_display, agency_data) if has_agency_data else create_empty_card(8),
+    ]
+
+    if cards_key is not None:
+        _last_cards_key = cards_key
+        _last_cards = cards
+
     return cards
 
 def create_agency_daily_performance_card(current_agency_display, agency_data):
@@ -2512,9 +2529,9 @@ def create_agency_daily_performance_card(current_agency_display, agency_data):
             if 'Quantity remediated today' in agency_data.columns:
                 # Sum today's actual processing for current agency only
                 agency_current_daily_rate = agency_data['Quantity remediated today'].fillna(0).sum()
-                logger.info(f"📊 {current_agency_display} today's processing: {agency_current_daily_rate} MT")
+                logger.info("📊 %s today's processing: %s MT", current_agency_display, agency_current_daily_rate)
             else:
-                logger.warning(f"⚠️ 'Quantity remediated today' column not found for {current_agency_display}, using fallback")
+                logger.warning("⚠️ 'Quantity remediated today' column not found for %s, using fallback", current_agency_display)
                 # Fallback: use Daily_Capacity if available
                 if 'Daily_Capacity' in agency_data.columns:
                     agency_current_daily_rate = agency_data['Daily_Capacity'].fillna(0).sum()
@@ -2534,20 +2551,20 @@ def create_agency_daily_performance_card(current_agency_display, agency_data):
                 
                 if days_remaining > 0:
                     agency_required_daily_rate = agency_remaining_quantity / days_remaining
-                    logger.info(f"📈 {current_agency_display} required rate: {agency_required_daily_rate} MT/day ({agency_remaining_quantity} MT remaining ÷ {days_remaining} days)")
+                    logger.info("📈 %s required rate: %s MT/day (%s MT remaining ÷ %s days)", current_agency_display, agency_required_daily_rate, agency_remaining_quantity, days_remaining)
                 else:
                     agency_required_daily_rate = agency_remaining_quantity
-                    logger.warning(f"⚠️ {current_agency_display} deadline passed! Remaining: {agency_remaining_quantity} MT")
+                    logger.warning("⚠️ %s deadline passed! Remaining: %s MT", current_agency_display, agency_remaining_quantity)
             else:
-                logger.warning(f"⚠️ Missing columns for {current_agency_display} required rate calculation")
+                logger.warning("⚠️ Missing columns for %s required rate calculation", current_agency_display)
                 agency_required_daily_rate = 0
                 
             # Round values for display
             agency_current_daily_rate = round(agency_current_daily_rate, 1)
             agency_required_daily_rate = round(agency_required_daily_rate, 1)
             
-            # Log agency performance comparison
-            if agency_required_daily_rate > 0:
+            # Log agency performance comparison (only format when INFO is actually emitted)
+            if agency_required_daily_rate > 0 and logger.isEnabledFor(logging.INFO):
                 performance_ratio = (agency_current_daily_rate / agency_required_daily_rate) * 100
                 if performance_ratio >= 100:
                     status = f"✅ AHEAD - {performance_ratio:.1f}% of target"
@@ -2557,14 +2574,14 @@ def create_agency_daily_performance_card(current_agency_display, agency_data):
                     status = f"⚠️ BEHIND - {performance_ratio:.1f}% of target"
                 else:
                     status = f"🚨 CRITICAL - {performance_ratio:.1f}% of target"
-                logger.info(f"🎯 {current_agency_display} Performance: {status}")
-            
+                logger.info("🎯 %s Performance: %s", current_agency_display, status)
+
         except Exception as e:
             logger.error(f"❌ Error calculating {current_agency_display} daily rates: {e}")
             agency_current_daily_rate = 0
             agency_required_daily_rate = 0
     else:
-        logger.warning(f"⚠️ No data available for {current_agency_display} daily rate calculation")
+        logger.warning("⚠️ No data available for %s daily rate calculation", current_agency_display)
     
     # Calculate agency performance percentage ← ADD THIS SECTION
     agency_performance_percentage = 0
@@ -2625,18 +2642,10 @@ def create_agency_daily_performance_card(current_agency_display, agency_data):
     def get_agency_performance_colors(current, required):
         if required <= 0:
             return "var(--info, #3182CE)", "var(--info, #3182CE)"
-        
-        performance_ratio = current / required
-        
-        if performance_ratio >= 1.0:
-            current_color = "var(--success, #38A169)"  # Green - Meeting or exceeding target
-        elif performance_ratio >= 0.8:
-            current_color = "var(--info, #3182CE)"     # Blue - Close to target
-        elif performance_ratio >= 0.5:
-            current_color = "var(--warning, #DD6B20)"  # Orange - Behind target
-        else:
-            current_color = "var(--error, #E53E3E)"    # Red - Critical performance
-        
+
+        # Table lookup on the performance ratio replaces the 4-way branch
+        current_color = _PERFORMANCE_COLORS[int(np.searchsorted(_PERFORMANCE_THRESHOLDS, current / required, side='right'))]
+
         # Required rate color based on urgency
         if days_remaining <= 30:
             required_color = "var(--error, #E53E3E)"   # Red - Very urgent
@@ -2817,42 +2826,82 @@ def create_hero_section():
         ]
     )
 
+# CSS hrefs fingerprinted by content once at import - the URL only changes
+# when the file changes, so browsers can cache it across page loads. These
+# stylesheets are excluded from Dash's global auto-injection (assets_ignore
+# in main.py) and loaded lazily by this layout only.
+def _fingerprinted_css(filename):
+    try:
+        with open(f"assets/css/{filename}", "rb") as css_file:
+            version = hashlib.md5(css_file.read()).hexdigest()[:8]
+    except OSError:
+        version = "1"
+    return f"/assets/css/{filename}?v={version}"
+
+
+_CSS_HREF = _fingerprinted_css("container_zoom_fix.css")
+_UNIFORM_CARDS_CSS_HREF = _fingerprinted_css("uniform_cards.css")
+
+# DEBUG: Check if assets folder exists (once at import, not per request)
+_ASSETS_CSS_PATH = "assets/css/uniform_cards.css"
+logger.info("🔍 CSS Debug: uniform_cards.css exists at %s: %s", _ASSETS_CSS_PATH, os.path.exists(_ASSETS_CSS_PATH))
+
+
+def _theme_css_vars(theme):
+    """Map one theme to the CSS custom-property dict the layout root uses"""
+    return {
+        "--primary-bg": theme["primary_bg"],
+        "--secondary-bg": theme["secondary_bg"],
+        "--accent-bg": theme["accent_bg"],
+        "--card-bg": theme["card_bg"],
+        "--text-primary": theme["text_primary"],
+        "--text-secondary": theme["text_secondary"],
+        "--brand-primary": theme["brand_primary"],
+        "--border-light": theme.get("border_light", theme["accent_bg"]),
+        "--success": theme["success"],
+        "--warning": theme["warning"],
+        "--error": theme["error"],
+        "--info": theme["info"]
+    }
+
+
+# One CSS-variable dict per theme, built at import and shared by every
+# layout build - Dash serializes the same constant instead of a fresh dict
+_THEME_CSS_VARS = {name: _theme_css_vars(theme) for name, theme in THEMES.items()}
+
+
 def build_public_layout(theme_name="dark", is_authenticated=False, user_data=None):
     """Build the public layout with enhanced card structure - project overview, 1x4 header cards, agency header, then 2x4 main cards"""
-    theme_styles = get_theme_styles(theme_name)
-    
-    # DEBUG: Check if assets folder exists
-    assets_path = "assets/css/uniform_cards.css"
-    css_exists = os.path.exists(assets_path)
-    logger.info(f"🔍 CSS Debug: uniform_cards.css exists at {assets_path}: {css_exists}")
-    
+    # The tree depends only on the theme, so repeat visits reuse the memoized subtree
+    return _build_public_layout_cached(theme_name, is_authenticated)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_public_layout_cached(theme_name, is_authenticated):
+    """Cached body of build_public_layout - keyed on (theme_name, is_authenticated)"""
     return html.Div(
         className="public-layout",
-        style={
-            "--primary-bg": theme_styles["theme"]["primary_bg"],
-            "--secondary-bg": theme_styles["theme"]["secondary_bg"],
-            "--accent-bg": theme_styles["theme"]["accent_bg"],
-            "--card-bg": theme_styles["theme"]["card_bg"],
-            "--text-primary": theme_styles["theme"]["text_primary"],
-            "--text-secondary": theme_styles["theme"]["text_secondary"],
-            "--brand-primary": theme_styles["theme"]["brand_primary"],
-            "--border-light": theme_styles["theme"].get("border_light", theme_styles["theme"]["accent_bg"]),
-            "--success": theme_styles["theme"]["success"],
-            "--warning": theme_styles["theme"]["warning"],
-            "--error": theme_styles["theme"]["error"],
-            "--info": theme_styles["theme"]["info"]
-        },
+        style=_THEME_CSS_VARS.get(theme_name, _THEME_CSS_VARS["dark"]),
         children=[
-            # Enhanced CSS Loading with timestamp to force refresh
+            # Lazy per-page CSS (hrefs fingerprinted once at import) - these
+            # sheets load only on this route, not globally
             html.Link(
                 rel="stylesheet",
-                href=f"/assets/css/container_zoom_fix.css?v={int(datetime.now().timestamp())}"
+                href=_UNIFORM_CARDS_CSS_HREF
+            ),
+            html.Link(
+                rel="stylesheet",
+                href=_CSS_HREF
             ),
         
             # In your public_layout_uniform.py, add mobile detection
                 
             dcc.Interval(id='auto-rotation-interval', interval=15*1000, n_intervals=0),
             dcc.Store(id='current-theme', data=theme_name),
+            dcc.Store(id='rotation-state'),
+            # What THIS client has already rendered (memory storage, so a
+            # reload starts blank and always gets a full first paint)
+            dcc.Store(id='dashboard-sent-state'),
             create_hover_overlay_banner(theme_name),
             html.Div(
                 className="main-content",
@@ -2867,88 +2916,197 @@ def build_public_layout(theme_name="dark", is_authenticated=False, user_data=Non
         ]
     )
 
+@functools.lru_cache(maxsize=16)
+def _agency_slice(agency_key, df_version):
+    """Memoized per-agency slice of the loaded frame, keyed by data version"""
+    df = _DATA_CACHE['df']
+    if df is None or agency_key is None or 'Agency' not in df.columns:
+        return pd.DataFrame()
+    return df[df['Agency'] == agency_key].copy()
+
+
+@functools.lru_cache(maxsize=32)
+def _metrics_for(agency_key, df_version):
+    """Memoized calculate_agency_metrics - recomputes only when the data version bumps"""
+    return calculate_agency_metrics(_agency_slice(agency_key, df_version))
+
+
+@functools.lru_cache(maxsize=32)
+def _lagging_for(agency_key, df_version):
+    """Memoized calculate_lagging_sites - recomputes only when the data version bumps"""
+    return calculate_lagging_sites(_agency_slice(agency_key, df_version))
+
+
 @callback(
-    [Output('project-overview-container', 'children'),  # NEW: Project overview first
-     Output('header-cards-container', 'children'),      # Header cards second
-     Output('agency-header-container', 'children'),     # Agency header third  
-     Output('dynamic-cards-container', 'children')],    # Main cards fourth
-    [Input('auto-rotation-interval', 'n_intervals'), Input('current-theme', 'data')],
+    Output('rotation-state', 'data'),
+    [Input('auto-rotation-interval', 'n_intervals')],
     prevent_initial_call=False
 )
-def update_agency_dashboard(n_intervals, theme_name):
-    """Update dashboard with enhanced card layout - project overview, 1x4 header cards, agency header, then 2x4 main cards"""
+def update_rotation_state(n_intervals):
+    """Advance the agency rotation - the only work performed on every tick"""
     try:
-        logger.info(f"🔄 Agency rotation update #{n_intervals}")
-        
+        logger.info("🔄 Agency rotation update #%s", n_intervals)
         df = load_agency_data()
-        rotation_data = get_agency_rotation_data(df, n_intervals)
-        current_agency_key = rotation_data['current_agency_key']
-        current_agency_display = rotation_data['current_agency_display']
-        agency_data = rotation_data['agency_data']
-        
-        logger.info(f"🏢 Displaying: {current_agency_display} (Records: {len(agency_data)})")
-        
-        # Calculate metrics
-        metrics = calculate_agency_metrics(agency_data)
-        
-        if not agency_data.empty:
-            try:
-                lagging_sites = calculate_lagging_sites(agency_data)
-                logger.info(f"🚨 Lagging Sites Summary: {len(lagging_sites)} sites cannot complete before Sept 30, 2025")
-            except Exception as lagging_error:
-                logger.warning(f"⚠️ Could not calculate lagging sites: {lagging_error}")
-        
-        theme_styles = get_theme_styles(theme_name or 'dark')
-        
-        # Create components in new order
-        project_overview = create_project_overview_header()  # NEW: Project overview first
-        header_cards = create_header_cards_grid(           # Header cards second - WITH DATA
+        rotation_data = get_agency_rotation_data(df, n_intervals or 0)
+        return {
+            'agency_key': rotation_data['current_agency_key'],
+            'agency_display': rotation_data['current_agency_display'],
+            'df_version': get_data_version()
+        }
+    except Exception as e:
+        logger.error(f"❌ Error in rotation update: {e}")
+        return {'agency_key': None, 'agency_display': 'Error Loading Data', 'df_version': -1}
+
+
+# Per-output memoized builders: each fragment is keyed only on the inputs
+# it actually depends on, so a theme flip rebuilds the main cards without
+# touching the header fragments and vice versa
+@functools.lru_cache(maxsize=1)
+def _project_overview_fragment():
+    """The project overview is static - built once per process"""
+    return create_project_overview_header()
+
+
+@functools.lru_cache(maxsize=32)
+def _agency_header_fragment(current_agency_display):
+    """Agency header depends only on the rotation's display name"""
+    return create_agency_header(current_agency_display)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_dashboard(agency_key, current_agency_display, df_version, theme_name, today):
+    """Build the four dashboard fragments - memoized per (agency, data version, theme, day)"""
+    df = _DATA_CACHE['df'] if _DATA_CACHE['df'] is not None else pd.DataFrame()
+    agency_data = _agency_slice(agency_key, df_version)
+
+    logger.info("🏢 Displaying: %s (Records: %s)", current_agency_display, len(agency_data))
+
+    # Calculate metrics (cached per data version)
+    metrics = _metrics_for(agency_key, df_version)
+
+    if not agency_data.empty:
+        try:
+            lagging_sites = _lagging_for(agency_key, df_version)
+            logger.info("🚨 Lagging Sites Summary: %s sites cannot complete before Sept 30, 2025", len(lagging_sites))
+        except Exception as lagging_error:
+            logger.warning(f"⚠️ Could not calculate lagging sites: {lagging_error}")
+
+    theme_styles = get_theme_styles(theme_name)
+
+    # Create components in new order - the theme-independent fragments come
+    # from their own narrower caches
+    project_overview = _project_overview_fragment()    # NEW: Project overview first
+    header_cards = create_header_cards_grid(           # Header cards second - WITH DATA
         current_agency_display=current_agency_display,
         agency_data=agency_data,
         all_agencies_data=df  # Pass ALL agencies data for project-wide metrics
-        )        # Header cards second
-        agency_header = create_agency_header(current_agency_display)  # Agency header third
-        main_cards = create_specific_metric_cards(current_agency_display, metrics, theme_styles, agency_data)  # Main cards fourth (2x4 grid)
-        
-        logger.info(f"✅ Created project overview, header cards, agency header, and {len(main_cards)} main cards for {current_agency_display}")
-        
-        # Return exactly 4 values in new order: project_overview, header_cards, agency_header, main_cards
-        return project_overview, header_cards, agency_header, main_cards
-        
+    )
+    agency_header = _agency_header_fragment(current_agency_display)  # Agency header third
+    main_cards = create_specific_metric_cards(current_agency_display, metrics, theme_styles, agency_data)  # Main cards fourth (2x4 grid)
+
+    logger.info("✅ Created project overview, header cards, agency header, and %s main cards for %s", len(main_cards), current_agency_display)
+
+    return project_overview, header_cards, agency_header, main_cards
+
+
+# Fallback content is identical on every failure, so build it once at import
+# instead of re-allocating 8+ components per error
+_FALLBACK_PROJECT_OVERVIEW = create_project_overview_header()
+_FALLBACK_HEADER_CARDS = create_header_cards_grid()
+_FALLBACK_AGENCY_HEADER = html.Div(
+    "Error Loading Agency Data",
+    className="agency-header",
+    style={'color': 'red', 'textAlign': 'center', 'padding': '1rem'}
+)
+_FALLBACK_EMPTY_CARDS = tuple(create_empty_card(i + 1) for i in range(8))
+
+_SIMPLE_PROJECT_OVERVIEW = html.Div("Loading project overview...", style={'padding': '1rem'})
+_SIMPLE_HEADER_CARDS = html.Div("Loading header cards...", style={'padding': '1rem'})
+_SIMPLE_AGENCY_HEADER = html.Div("System Error", style={'color': 'red', 'padding': '1rem'})
+_SIMPLE_LOADING_CARDS = tuple(html.Div("Loading...", style={'padding': '1rem'}) for _ in range(8))
+
+@callback(
+    [Output('project-overview-container', 'children'),  # NEW: Project overview first
+     Output('header-cards-container', 'children'),      # Header cards second
+     Output('agency-header-container', 'children'),     # Agency header third
+     Output('dynamic-cards-container', 'children'),     # Main cards fourth
+     Output('dashboard-sent-state', 'data')],           # What this client now has
+    [Input('rotation-state', 'data'), Input('current-theme', 'data')],
+    [State('dashboard-sent-state', 'data')],
+    prevent_initial_call=False
+)
+def update_agency_dashboard(rotation_state, theme_name, sent_state):
+    """Update dashboard with enhanced card layout - project overview, 1x4 header cards, agency header, then 2x4 main cards"""
+    try:
+        rotation_state = rotation_state or {}
+        sent_state = sent_state or {}
+
+        # When the rotation lands on the same (agency, data version, theme)
+        # this client already rendered, the serialized payload would be
+        # byte-identical - skip re-serializing/resending all 4 outputs.
+        # The comparison key is held by the client (dashboard-sent-state),
+        # not the process: other browsers and fresh page loads carry no
+        # key yet and therefore always get a full first paint.
+        response_key = [
+            rotation_state.get('agency_key'),
+            rotation_state.get('df_version', -1),
+            theme_name or 'dark',
+            str(datetime.now().date())
+        ]
+        if response_key == sent_state.get('last_key'):
+            return (no_update, no_update, no_update, no_update, no_update)
+
+        current_agency_display = rotation_state.get('agency_display', 'No Data Available')
+        data_key = [rotation_state.get('df_version', -1), str(datetime.now().date())]
+
+        # Build exactly 4 values in new order: project_overview, header_cards, agency_header, main_cards
+        project_overview, header_cards, agency_header, main_cards = _render_dashboard(
+            rotation_state.get('agency_key'),
+            current_agency_display,
+            rotation_state.get('df_version', -1),
+            theme_name or 'dark',
+            datetime.now().date()
+        )
+
+        # Suppress Outputs THIS CLIENT already holds (read from its
+        # store, never from process state): the project overview is
+        # static after the client's first paint, the agency header only
+        # follows the rotation, and the header cards only follow
+        # rotation or a data refresh. Main cards also depend on theme,
+        # so they are always sent when the payload key changed.
+        if sent_state.get('overview_sent'):
+            project_overview = no_update
+        if current_agency_display == sent_state.get('agency'):
+            agency_header = no_update
+            if data_key == sent_state.get('data_key'):
+                header_cards = no_update
+
+        new_sent_state = {
+            'last_key': response_key,
+            'overview_sent': True,
+            'agency': current_agency_display,
+            'data_key': data_key,
+        }
+
+        return project_overview, header_cards, agency_header, main_cards, new_sent_state
+
     except Exception as e:
         logger.error(f"❌ Error in dashboard update: {e}")
         import traceback
         traceback.print_exc()
-        
-        # Create fallback content - ALWAYS return exactly 4 values
+
+        # Clearing the client's store makes its next tick repaint in full
+        # Fallback content is prebuilt at import - ALWAYS return exactly 5 values
         try:
-            fallback_project_overview = create_project_overview_header()  # Use default project overview
-            fallback_header_cards = create_header_cards_grid()  # Use default header cards
-            
-            fallback_agency_header = html.Div(
-                "Error Loading Agency Data",
-                className="agency-header",
-                style={'color': 'red', 'textAlign': 'center', 'padding': '1rem'}
-            )
-            
-            fallback_main_cards = []
-            for i in range(8):
-                fallback_main_cards.append(create_empty_card(i + 1))
-            
-            # Return exactly 4 values in new order
-            return fallback_project_overview, fallback_header_cards, fallback_agency_header, fallback_main_cards
-            
+            return (_FALLBACK_PROJECT_OVERVIEW, _FALLBACK_HEADER_CARDS,
+                    _FALLBACK_AGENCY_HEADER, list(_FALLBACK_EMPTY_CARDS), {})
+
         except Exception as fallback_error:
             logger.error(f"❌ Error creating fallback content: {fallback_error}")
-            
-            # Ultimate fallback - simple HTML elements, exactly 4 values
-            simple_project_overview = html.Div("Loading project overview...", style={'padding': '1rem'})
-            simple_header_cards = html.Div("Loading header cards...", style={'padding': '1rem'})
-            simple_agency_header = html.Div("System Error", style={'color': 'red', 'padding': '1rem'})
-            simple_main_cards = [html.Div("Loading...", style={'padding': '1rem'}) for _ in range(8)]
-            
-            # Return exactly 4 values in new order
-            return simple_project_overview, simple_header_cards, simple_agency_header, simple_main_cards
+
+            # Ultimate fallback - simple HTML elements, exactly 5 values
+            return (_SIMPLE_PROJECT_OVERVIEW, _SIMPLE_HEADER_CARDS,
+                    _SIMPLE_AGENCY_HEADER, list(_SIMPLE_LOADING_CARDS), {})
 
 # Export functions
 __all__ = [
@@ -2980,3 +3138,29 @@ try:
     print("✅ Public layout callbacks registered successfully")
 except Exception as e:
     print(f"❌ Failed to register public layout callbacks: {e}")
+
+
+def _warm_first_paint():
+    """Pre-render the first rotation payload for the default theme at import
+
+    The Interval fires n_intervals=0 the moment the page loads; without
+    this the first tick blocks on CSV parse + metrics compute. Rendering
+    tick 0 here fills every lru_cache involved, so the cold first
+    callback is a pure cache hit.
+    """
+    df = load_agency_data()
+    rotation_data = get_agency_rotation_data(df, 0)
+    _render_dashboard(
+        rotation_data['current_agency_key'],
+        rotation_data['current_agency_display'],
+        get_data_version(),
+        'dark',
+        datetime.now().date()
+    )
+    logger.info("🎨 First-paint dashboard pre-rendered for %s", rotation_data['current_agency_display'])
+
+
+try:
+    _warm_first_paint()
+except Exception as e:
+    logger.warning(f"⚠️ Could not pre-render first paint: {e}")
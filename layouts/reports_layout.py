@@ -4,101 +4,318 @@ Reports Page Layout with Comprehensive Theme Support
 Following themes.py structure with Agency, Cluster, Site, and Date filters
 """
 
+import functools
+import time
+import types
+
 from dash import html, dcc
 from datetime import datetime, timedelta
 from config.themes import THEMES, DEFAULT_THEME
 
+# Process-boot date token: datetime.now() is surprisingly costly when called
+# per layout build, and the date only matters for the DatePickerRange
+# defaults.  Refresh the cached date at most once an hour via a cheap
+# monotonic-clock comparison.
+_BOOT_DATE = datetime.now().date()
+_BOOT_MONO = time.monotonic()
+_DATE_REFRESH_SECONDS = 3600
+
+
+def _current_date():
+    """Today's date, recomputed at most once an hour instead of per call"""
+    global _BOOT_DATE, _BOOT_MONO
+    if time.monotonic() - _BOOT_MONO > _DATE_REFRESH_SECONDS:
+        _BOOT_DATE = datetime.now().date()
+        _BOOT_MONO = time.monotonic()
+    return _BOOT_DATE
+
+
+def _build_styles(theme):
+    """Precompute every style dict the reports builders use for one theme
+
+    The dicts are shared across every card/item built for that theme, so
+    treat them as frozen - never mutate one inside a builder. (They stay
+    plain dicts rather than MappingProxyType because Dash's plotly JSON
+    encoder cannot serialize mappingproxy objects.)
+    """
+    border_light = f"1px solid {theme['border_light']}"
+
+    return types.SimpleNamespace(
+        page={
+            'minHeight': '100vh',
+            'backgroundColor': theme['primary_bg'],
+            'color': theme['text_primary'],
+            'fontFamily': 'Inter, sans-serif'
+        },
+        header_container={
+            'background': f"linear-gradient(135deg, {theme['secondary_bg']} 0%, {theme['accent_bg']} 100%)",
+            'padding': '2rem',
+            'borderBottom': border_light,
+            'boxShadow': '0 2px 8px rgba(0, 0, 0, 0.1)'
+        },
+        header_inner={
+            'maxWidth': '1200px',
+            'margin': '0 auto',
+            'display': 'flex',
+            'justifyContent': 'space-between',
+            'alignItems': 'center'
+        },
+        header_title={
+            'color': theme['text_primary'],
+            'fontSize': '2.5rem',
+            'fontWeight': '700',
+            'margin': '0',
+            'display': 'flex',
+            'alignItems': 'center',
+            'gap': '1rem'
+        },
+        header_subtitle={
+            'color': theme['text_secondary'],
+            'fontSize': '1.1rem',
+            'margin': '0.5rem 0 0 0',
+            'fontWeight': '400'
+        },
+        status_badge={
+            'background': theme['brand_primary'],
+            'color': 'white',
+            'padding': '0.5rem 1rem',
+            'borderRadius': '20px',
+            'fontSize': '0.9rem',
+            'fontWeight': '600'
+        },
+        filter_container={
+            'backgroundColor': theme['accent_bg'],
+            'padding': '1.5rem',
+            'borderBottom': border_light
+        },
+        filter_inner={
+            'maxWidth': '1200px',
+            'margin': '0 auto'
+        },
+        filter_title={
+            'color': theme['text_primary'],
+            'fontSize': '1.3rem',
+            'marginBottom': '1rem',
+            'fontWeight': '600'
+        },
+        filter_grid={
+            'display': 'grid',
+            'gridTemplateColumns': 'repeat(auto-fit, minmax(200px, 1fr))',
+            'gap': '1rem',
+            'alignItems': 'end'
+        },
+        filter_label={
+            'color': theme['text_secondary'],
+            'fontSize': '0.9rem',
+            'fontWeight': '500',
+            'marginBottom': '0.5rem',
+            'display': 'block'
+        },
+        dropdown={
+            'backgroundColor': theme['card_bg'],
+            'color': theme['text_primary']
+        },
+        datepicker={
+            'backgroundColor': theme['card_bg']
+        },
+        generate_btn={
+            'backgroundColor': theme['brand_primary'],
+            'color': 'white',
+            'border': 'none',
+            'padding': '0.75rem 1.5rem',
+            'borderRadius': '6px',
+            'fontSize': '0.9rem',
+            'fontWeight': '600',
+            'cursor': 'pointer',
+            'width': '100%'
+        },
+        content_area={
+            'maxWidth': '1200px',
+            'margin': '0 auto',
+            'padding': '2rem'
+        },
+        welcome={
+            'background': f"linear-gradient(135deg, {theme['accent_bg']} 0%, {theme['card_bg']} 100%)",
+            'padding': '2rem',
+            'borderRadius': '12px',
+            'marginBottom': '2rem',
+            'border': border_light,
+            'textAlign': 'center'
+        },
+        welcome_title={
+            'color': theme['text_primary'],
+            'fontSize': '1.8rem',
+            'fontWeight': '600',
+            'marginBottom': '1rem'
+        },
+        welcome_text={
+            'color': theme['text_secondary'],
+            'fontSize': '1.1rem',
+            'lineHeight': '1.6',
+            'maxWidth': '600px',
+            'margin': '0 auto'
+        },
+        reports_grid={
+            'display': 'grid',
+            'gridTemplateColumns': 'repeat(auto-fit, minmax(300px, 1fr))',
+            'gap': '1.5rem',
+            'marginBottom': '2rem'
+        },
+        report_card={
+            'backgroundColor': theme['card_bg'],
+            'padding': '1.5rem',
+            'borderRadius': '12px',
+            'border': border_light,
+            'boxShadow': '0 2px 4px rgba(0, 0, 0, 0.1)'
+        },
+        report_card_title={
+            'color': theme['text_primary'],
+            'fontSize': '1.2rem',
+            'fontWeight': '600',
+            'marginBottom': '0.5rem'
+        },
+        report_card_desc={
+            'color': theme['text_secondary'],
+            'fontSize': '0.9rem',
+            'marginBottom': '1rem',
+            'lineHeight': '1.4'
+        },
+        report_feature={
+            'color': theme['text_primary'],
+            'fontSize': '0.85rem',
+            'margin': '0.25rem 0',
+            'fontWeight': '400'
+        },
+        reports_list_container={
+            'backgroundColor': theme['card_bg'],
+            'padding': '2rem',
+            'borderRadius': '12px',
+            'border': border_light
+        },
+        reports_list_title={
+            'color': theme['text_primary'],
+            'marginBottom': '1.5rem',
+            'fontSize': '1.4rem',
+            'fontWeight': '600'
+        },
+        reports_list_grid={
+            'display': 'grid',
+            'gridTemplateColumns': 'repeat(auto-fit, minmax(250px, 1fr))',
+            'gap': '1rem'
+        },
+        report_item={
+            'backgroundColor': theme['accent_bg'],
+            'padding': '1rem',
+            'borderRadius': '8px',
+            'border': border_light,
+            'cursor': 'pointer',
+            'transition': 'transform 0.2s ease'
+        },
+        report_item_title={
+            'color': theme['text_primary'],
+            'fontSize': '1rem',
+            'fontWeight': '600',
+            'marginBottom': '0.5rem'
+        },
+        report_item_desc={
+            'color': theme['text_secondary'],
+            'fontSize': '0.85rem',
+            'marginBottom': '0.5rem',
+            'lineHeight': '1.3'
+        },
+        report_item_updated={
+            'color': theme['brand_primary'],
+            'fontSize': '0.75rem',
+            'fontWeight': '500',
+            'margin': '0'
+        }
+    )
+
+
+# One precomputed style namespace per theme - builders below only do lookups
+_REPORTS_STYLES = {name: _build_styles(theme) for name, theme in THEMES.items()}
+
+# Dropdown options never change - frozen tuples built once at import
+_REPORT_TYPE_OPTIONS = (
+    {'label': 'All Reports', 'value': 'all'},
+    {'label': 'Monthly Summary', 'value': 'monthly'},
+    {'label': 'Weekly Progress', 'value': 'weekly'},
+    {'label': 'Daily Operations', 'value': 'daily'},
+    {'label': 'Custom Reports', 'value': 'custom'}
+)
+_AGENCY_OPTIONS = (
+    {'label': 'All Agencies', 'value': 'all'},
+    {'label': 'Municipal Corporation', 'value': 'municipal'},
+    {'label': 'Panchayat Raj', 'value': 'panchayat'},
+    {'label': 'Urban Development', 'value': 'urban'}
+)
+
+
 def create_reports_layout(theme_name=None, user_data=None):
     """
     Create comprehensive reports page layout with filter container
-    
+
     Args:
         theme_name (str): Current theme name
         user_data (dict): User information
-        
+
     Returns:
         html.Div: Complete reports layout
     """
-    if theme_name is None:
+    if theme_name is None or theme_name not in THEMES:
         theme_name = DEFAULT_THEME
-    
-    theme = THEMES.get(theme_name, THEMES[DEFAULT_THEME])
-    
+
+    # The tree depends only on theme (plus today's date for the default
+    # date-range), so repeat visits reuse the memoized subtree
+    return _build_reports_layout(theme_name, _current_date())
+
+
+@functools.lru_cache(maxsize=len(THEMES) * 2)
+def _build_reports_layout(theme_name, today):
+    """Cached body of create_reports_layout - keyed on (theme_name, today)"""
+    s = _REPORTS_STYLES[theme_name]
+
     return html.Div(
-        style={
-            'minHeight': '100vh',
-            'backgroundColor': theme['primary_bg'],
-            'color': theme['text_primary'],
-            'fontFamily': 'Inter, sans-serif'
-        },
+        style=s.page,
         children=[
             # Page Header
-            create_reports_header(theme),
-            
+            create_reports_header(theme_name),
+
             # Filter Container
-            create_filter_container(theme),
-            
+            create_filter_container(theme_name, today),
+
             # Content Area (placeholder for now)
-            create_content_area(theme)
+            create_content_area(theme_name)
         ]
     )
 
-def create_reports_header(theme):
+
+def create_reports_header(theme_name):
     """Create reports page header section"""
+    s = _REPORTS_STYLES[theme_name]
     return html.Div(
-        style={
-            'background': f"linear-gradient(135deg, {theme['secondary_bg']} 0%, {theme['accent_bg']} 100%)",
-            'padding': '2rem',
-            'borderBottom': f"1px solid {theme['border_light']}",
-            'boxShadow': '0 2px 8px rgba(0, 0, 0, 0.1)'
-        },
+        style=s.header_container,
         children=[
             html.Div(
-                style={
-                    'maxWidth': '1200px',
-                    'margin': '0 auto',
-                    'display': 'flex',
-                    'justifyContent': 'space-between',
-                    'alignItems': 'center'
-                },
+                style=s.header_inner,
                 children=[
                     # Title Section
                     html.Div([
                         html.H1(
                             "📋 Reports Dashboard",
-                            style={
-                                'color': theme['text_primary'],
-                                'fontSize': '2.5rem',
-                                'fontWeight': '700',
-                                'margin': '0',
-                                'display': 'flex',
-                                'alignItems': 'center',
-                                'gap': '1rem'
-                            }
+                            style=s.header_title
                         ),
                         html.P(
                             "Generate, view, and manage comprehensive reports",
-                            style={
-                                'color': theme['text_secondary'],
-                                'fontSize': '1.1rem',
-                                'margin': '0.5rem 0 0 0',
-                                'fontWeight': '400'
-                            }
+                            style=s.header_subtitle
                         )
                     ]),
-                    
+
                     # Status Indicator
                     html.Div([
                         html.Div(
                             "📊 Ready",
-                            style={
-                                'background': theme['brand_primary'],
-                                'color': 'white',
-                                'padding': '0.5rem 1rem',
-                                'borderRadius': '20px',
-                                'fontSize': '0.9rem',
-                                'fontWeight': '600'
-                            }
+                            style=s.status_badge
                         )
                     ])
                 ]
@@ -106,133 +323,74 @@ def create_reports_header(theme):
         ]
     )
 
-def create_filter_container(theme):
+
+def create_filter_container(theme_name, today=None):
     """Create filter container section"""
+    s = _REPORTS_STYLES[theme_name]
+    if today is None:
+        today = _current_date()
+
     return html.Div(
-        style={
-            'backgroundColor': theme['accent_bg'],
-            'padding': '1.5rem',
-            'borderBottom': f"1px solid {theme['border_light']}"
-        },
+        style=s.filter_container,
         children=[
             html.Div(
-                style={
-                    'maxWidth': '1200px',
-                    'margin': '0 auto'
-                },
+                style=s.filter_inner,
                 children=[
                     html.H3(
                         "📝 Report Filters",
-                        style={
-                            'color': theme['text_primary'],
-                            'fontSize': '1.3rem',
-                            'marginBottom': '1rem',
-                            'fontWeight': '600'
-                        }
+                        style=s.filter_title
                     ),
                     html.Div(
-                        style={
-                            'display': 'grid',
-                            'gridTemplateColumns': 'repeat(auto-fit, minmax(200px, 1fr))',
-                            'gap': '1rem',
-                            'alignItems': 'end'
-                        },
+                        style=s.filter_grid,
                         children=[
                             # Report Type Filter
                             html.Div([
                                 html.Label(
                                     "Report Type:",
-                                    style={
-                                        'color': theme['text_secondary'],
-                                        'fontSize': '0.9rem',
-                                        'fontWeight': '500',
-                                        'marginBottom': '0.5rem',
-                                        'display': 'block'
-                                    }
+                                    style=s.filter_label
                                 ),
                                 dcc.Dropdown(
                                     id='reports-type-filter',
-                                    options=[
-                                        {'label': 'All Reports', 'value': 'all'},
-                                        {'label': 'Monthly Summary', 'value': 'monthly'},
-                                        {'label': 'Weekly Progress', 'value': 'weekly'},
-                                        {'label': 'Daily Operations', 'value': 'daily'},
-                                        {'label': 'Custom Reports', 'value': 'custom'}
-                                    ],
+                                    options=_REPORT_TYPE_OPTIONS,
                                     value='all',
-                                    style={
-                                        'backgroundColor': theme['card_bg'],
-                                        'color': theme['text_primary']
-                                    }
+                                    style=s.dropdown
                                 )
                             ]),
-                            
+
                             # Agency Filter
                             html.Div([
                                 html.Label(
                                     "Agency:",
-                                    style={
-                                        'color': theme['text_secondary'],
-                                        'fontSize': '0.9rem',
-                                        'fontWeight': '500',
-                                        'marginBottom': '0.5rem',
-                                        'display': 'block'
-                                    }
+                                    style=s.filter_label
                                 ),
                                 dcc.Dropdown(
                                     id='reports-agency-filter',
-                                    options=[
-                                        {'label': 'All Agencies', 'value': 'all'},
-                                        {'label': 'Municipal Corporation', 'value': 'municipal'},
-                                        {'label': 'Panchayat Raj', 'value': 'panchayat'},
-                                        {'label': 'Urban Development', 'value': 'urban'}
-                                    ],
+                                    options=_AGENCY_OPTIONS,
                                     value='all',
-                                    style={
-                                        'backgroundColor': theme['card_bg'],
-                                        'color': theme['text_primary']
-                                    }
+                                    style=s.dropdown
                                 )
                             ]),
-                            
+
                             # Date Range Filter
                             html.Div([
                                 html.Label(
                                     "Date Range:",
-                                    style={
-                                        'color': theme['text_secondary'],
-                                        'fontSize': '0.9rem',
-                                        'fontWeight': '500',
-                                        'marginBottom': '0.5rem',
-                                        'display': 'block'
-                                    }
+                                    style=s.filter_label
                                 ),
                                 dcc.DatePickerRange(
                                     id='reports-date-filter',
-                                    start_date=datetime.now() - timedelta(days=30),
-                                    end_date=datetime.now(),
-                                    style={
-                                        'backgroundColor': theme['card_bg']
-                                    }
+                                    start_date=today - timedelta(days=30),
+                                    end_date=today,
+                                    style=s.datepicker
                                 )
                             ]),
-                            
+
                             # Generate Button
                             html.Div([
                                 html.Button(
                                     "📊 Generate Report",
                                     id='reports-generate-btn',
-                                    style={
-                                        'backgroundColor': theme['brand_primary'],
-                                        'color': 'white',
-                                        'border': 'none',
-                                        'padding': '0.75rem 1.5rem',
-                                        'borderRadius': '6px',
-                                        'fontSize': '0.9rem',
-                                        'fontWeight': '600',
-                                        'cursor': 'pointer',
-                                        'width': '100%'
-                                    }
+                                    style=s.generate_btn
                                 )
                             ])
                         ]
@@ -242,107 +400,68 @@ def create_filter_container(theme):
         ]
     )
 
-def create_content_area(theme):
+
+def create_content_area(theme_name):
     """Create main content area"""
+    s = _REPORTS_STYLES[theme_name]
     return html.Div(
-        style={
-            'maxWidth': '1200px',
-            'margin': '0 auto',
-            'padding': '2rem'
-        },
+        style=s.content_area,
         children=[
             # Welcome Section
             html.Div(
-                style={
-                    'background': f"linear-gradient(135deg, {theme['accent_bg']} 0%, {theme['card_bg']} 100%)",
-                    'padding': '2rem',
-                    'borderRadius': '12px',
-                    'marginBottom': '2rem',
-                    'border': f"1px solid {theme['border_light']}",
-                    'textAlign': 'center'
-                },
+                style=s.welcome,
                 children=[
                     html.H2(
                         "👋 Hi! Welcome to Reports",
-                        style={
-                            'color': theme['text_primary'],
-                            'fontSize': '1.8rem',
-                            'fontWeight': '600',
-                            'marginBottom': '1rem'
-                        }
+                        style=s.welcome_title
                     ),
                     html.P(
                         "Your comprehensive reports dashboard is ready. Use the filters above to generate detailed reports on waste management activities.",
-                        style={
-                            'color': theme['text_secondary'],
-                            'fontSize': '1.1rem',
-                            'lineHeight': '1.6',
-                            'maxWidth': '600px',
-                            'margin': '0 auto'
-                        }
+                        style=s.welcome_text
                     )
                 ]
             ),
-            
+
             # Reports Grid
             html.Div(
-                style={
-                    'display': 'grid',
-                    'gridTemplateColumns': 'repeat(auto-fit, minmax(300px, 1fr))',
-                    'gap': '1.5rem',
-                    'marginBottom': '2rem'
-                },
+                style=s.reports_grid,
                 children=[
                     create_report_card(
                         "📊 Summary Reports",
                         "Comprehensive overview of operations",
                         ["Monthly collections summary", "Performance metrics", "Efficiency indicators"],
-                        theme
+                        theme_name
                     ),
                     create_report_card(
                         "📈 Trend Analysis",
                         "Historical data and patterns",
                         ["Quarterly trends", "Year-over-year comparison", "Seasonal variations"],
-                        theme
+                        theme_name
                     ),
                     create_report_card(
                         "🎯 Compliance Reports",
                         "Regulatory and compliance tracking",
                         ["Environmental compliance", "Safety standards", "Quality metrics"],
-                        theme
+                        theme_name
                     )
                 ]
             ),
-            
+
             # Available Reports List
             html.Div(
-                style={
-                    'backgroundColor': theme['card_bg'],
-                    'padding': '2rem',
-                    'borderRadius': '12px',
-                    'border': f"1px solid {theme['border_light']}"
-                },
+                style=s.reports_list_container,
                 children=[
                     html.H3(
                         "📋 Available Reports",
-                        style={
-                            'color': theme['text_primary'],
-                            'marginBottom': '1.5rem',
-                            'fontSize': '1.4rem',
-                            'fontWeight': '600'
-                        }
+                        style=s.reports_list_title
                     ),
                     html.Div(
-                        style={
-                            'display': 'grid',
-                            'gridTemplateColumns': 'repeat(auto-fit, minmax(250px, 1fr))',
-                            'gap': '1rem'
-                        },
+                        style=s.reports_list_grid,
                         children=[
-                            create_report_item("Daily Operations Report", "Today's activities and metrics", "Updated 2 hours ago", theme),
-                            create_report_item("Weekly Summary", "7-day performance overview", "Updated yesterday", theme),
-                            create_report_item("Monthly Dashboard", "Comprehensive monthly analysis", "Updated 3 days ago", theme),
-                            create_report_item("Quarterly Review", "Strategic performance review", "Updated last week", theme)
+                            create_report_item("Daily Operations Report", "Today's activities and metrics", "Updated 2 hours ago", theme_name),
+                            create_report_item("Weekly Summary", "7-day performance overview", "Updated yesterday", theme_name),
+                            create_report_item("Monthly Dashboard", "Comprehensive monthly analysis", "Updated 3 days ago", theme_name),
+                            create_report_item("Quarterly Review", "Strategic performance review", "Updated last week", theme_name)
                         ]
                     )
                 ]
@@ -350,87 +469,49 @@ def create_content_area(theme):
         ]
     )
 
-def create_report_card(title, description, features, theme):
+
+def create_report_card(title, description, features, theme_name):
     """Create a report category card component"""
+    s = _REPORTS_STYLES[theme_name]
+    # One shared style dict for every bullet - bind it once outside the
+    # comprehension rather than looking it up per feature
+    feature_style = s.report_feature
     return html.Div(
-        style={
-            'backgroundColor': theme['card_bg'],
-            'padding': '1.5rem',
-            'borderRadius': '12px',
-            'border': f"1px solid {theme['border_light']}",
-            'boxShadow': '0 2px 4px rgba(0, 0, 0, 0.1)'
-        },
+        style=s.report_card,
         children=[
             html.H4(
                 title,
-                style={
-                    'color': theme['text_primary'],
-                    'fontSize': '1.2rem',
-                    'fontWeight': '600',
-                    'marginBottom': '0.5rem'
-                }
+                style=s.report_card_title
             ),
             html.P(
                 description,
-                style={
-                    'color': theme['text_secondary'],
-                    'fontSize': '0.9rem',
-                    'marginBottom': '1rem',
-                    'lineHeight': '1.4'
-                }
+                style=s.report_card_desc
             ),
             html.Div([
-                html.P(
-                    f"• {feature}",
-                    style={
-                        'color': theme['text_primary'],
-                        'fontSize': '0.85rem',
-                        'margin': '0.25rem 0',
-                        'fontWeight': '400'
-                    }
-                ) for feature in features
+                html.P(f"• {feature}", style=feature_style)
+                for feature in features
             ])
         ]
     )
 
-def create_report_item(title, description, last_updated, theme):
+
+def create_report_item(title, description, last_updated, theme_name):
     """Create a report item component"""
+    s = _REPORTS_STYLES[theme_name]
     return html.Div(
-        style={
-            'backgroundColor': theme['accent_bg'],
-            'padding': '1rem',
-            'borderRadius': '8px',
-            'border': f"1px solid {theme['border_light']}",
-            'cursor': 'pointer',
-            'transition': 'transform 0.2s ease'
-        },
+        style=s.report_item,
         children=[
             html.H5(
                 title,
-                style={
-                    'color': theme['text_primary'],
-                    'fontSize': '1rem',
-                    'fontWeight': '600',
-                    'marginBottom': '0.5rem'
-                }
+                style=s.report_item_title
             ),
             html.P(
                 description,
-                style={
-                    'color': theme['text_secondary'],
-                    'fontSize': '0.85rem',
-                    'marginBottom': '0.5rem',
-                    'lineHeight': '1.3'
-                }
+                style=s.report_item_desc
             ),
             html.P(
                 last_updated,
-                style={
-                    'color': theme['brand_primary'],
-                    'fontSize': '0.75rem',
-                    'fontWeight': '500',
-                    'margin': '0'
-                }
+                style=s.report_item_updated
             )
         ]
-    )
\ No newline at end of file
+    )
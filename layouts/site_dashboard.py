@@ -2,271 +2,275 @@
 """
 Site-specific Dashboard Layout - Simplified Version
 Uses basic colors, no complex theming needed
+
+Static styling lives in assets/site_dashboard.css (lazy-loaded by this
+layout only); components carry sd-* class names instead of inline style
+dicts, so the serialized tree ships class strings rather than
+multi-hundred-byte style objects.
+
+The page stays a Dash component tree (memoized per site) rather than a
+pre-rendered HTML string: raw-HTML embedding would need an extra
+dependency or an iframe that isolates the stylesheet and the
+back-to-magic-view-btn callback, and with the class names + caching the
+serialized payload is already a few KB served from cache.
 """
 
+import functools
+import hashlib
+import os
+
 from dash import html, dcc
 
+
+def _fingerprinted_css(filename):
+    """Href for an assets stylesheet with a content-hash cache-buster"""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', filename)
+    try:
+        with open(path, 'rb') as f:
+            version = hashlib.md5(f.read()).hexdigest()[:8]
+    except OSError:
+        version = "1"
+    return f"/assets/{filename}?v={version}"
+
+
+_SITE_DASHBOARD_CSS_HREF = _fingerprinted_css("site_dashboard.css")
+
+
 def build_site_dashboard_layout(theme_name="dark", site_name="Unknown Site"):
     """
     Build a simple pretty dashboard layout for the selected site
-    
+
+    The layout is deterministic per (theme_name, site_name) and the set
+    of sites is small, so the full tree is memoized - repeat visits to a
+    site are an O(1) cache lookup. Consumers must treat the returned
+    tree as read-only; nothing in this repo mutates layouts after build.
+
     Args:
         theme_name (str): Current theme name (ignored, using fixed colors)
         site_name (str): Selected site name
-        
+
     Returns:
         html.Div: Complete site dashboard layout
     """
-    
+    return _build_site_dashboard_cached(theme_name, site_name)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_site_dashboard_cached(theme_name, site_name):
+    """Cached body of build_site_dashboard_layout
+
+    Only the three site-name-bearing nodes (header H1, welcome H2,
+    location status item) are constructed on a miss - everything else is
+    a static fragment built once at import and shared across builds.
+    """
     return html.Div(
-        className="site-dashboard-layout",
-        style={
-            "minHeight": "100vh",
-            "backgroundColor": "#0A0E1A",
-            "color": "#FFFFFF",
-            "fontFamily": "'Inter', sans-serif"
-        },
-        children=[
+        className="site-dashboard-layout sd-page",
+        children=(
+            # Lazy per-page CSS (href fingerprinted once at import)
+            _STATIC_CSS_LINK,
+
             # Header Section
             html.Div(
-                className="dashboard-header",
-                style={
-                    "background": "linear-gradient(135deg, #eb9534 0%, #1A1F2E 100%)",
-                    "padding": "2rem 1rem",
-                    "marginBottom": "2rem",
-                    "borderRadius": "0 0 20px 20px",
-                    "boxShadow": "0 10px 30px rgba(0, 0, 0, 0.3)"
-                },
-                children=[
+                className="dashboard-header sd-header",
+                children=(
                     html.Div(
-                        style={"maxWidth": "1200px", "margin": "0 auto", "textAlign": "center"},
-                        children=[
-                            html.H1(
-                                f"🏢 {site_name} Dashboard",
-                                style={
-                                    "color": "white",
-                                    "fontSize": "2.5rem",
-                                    "fontWeight": "800",
-                                    "marginBottom": "0.5rem",
-                                    "textShadow": "0 2px 4px rgba(0, 0, 0, 0.3)"
-                                }
-                            ),
-                            html.P(
-                                "Real-time operations and analytics dashboard",
-                                style={
-                                    "color": "rgba(255, 255, 255, 0.9)",
-                                    "fontSize": "1.2rem",
-                                    "marginBottom": "1rem"
-                                }
-                            ),
-                            # Navigation back to Magic View
-                            html.Button(
-                                [html.Span("← "), "Back to Magic View"],
-                                id="back-to-magic-view-btn",
-                                style={
-                                    "backgroundColor": "rgba(255, 255, 255, 0.2)",
-                                    "border": "2px solid rgba(255, 255, 255, 0.3)",
-                                    "color": "white",
-                                    "padding": "0.8rem 1.5rem",
-                                    "borderRadius": "10px",
-                                    "fontSize": "1rem",
-                                    "fontWeight": "600",
-                                    "cursor": "pointer",
-                                    "transition": "all 0.3s ease"
-                                }
-                            )
-                        ]
-                    )
-                ]
+                        className="sd-header-inner",
+                        children=(
+                            _h1_for_site(site_name),
+                            _STATIC_SUBTITLE,
+                            _STATIC_BACK_BTN
+                        )
+                    ),
+                )
             ),
-            
+
             # Main Dashboard Content
             html.Div(
-                className="dashboard-content",
-                style={
-                    "maxWidth": "1200px",
-                    "margin": "0 auto",
-                    "padding": "0 1rem"
-                },
-                children=[
+                className="dashboard-content sd-content",
+                children=(
                     # Welcome Section
                     html.Div(
-                        style={
-                            "backgroundColor": "#2D3748",
-                            "borderRadius": "16px",
-                            "padding": "2.5rem",
-                            "marginBottom": "2rem",
-                            "border": "2px solid #1A1F2E",
-                            "boxShadow": "0 8px 25px rgba(0, 0, 0, 0.15)",
-                            "textAlign": "center"
-                        },
-                        children=[
-                            html.Div("🌟", style={"fontSize": "4rem", "marginBottom": "1rem"}),
-                            html.H2(
-                                f"Welcome to {site_name}",
-                                style={
-                                    "color": "#FFFFFF",
-                                    "fontSize": "2rem",
-                                    "fontWeight": "700",
-                                    "marginBottom": "1rem"
-                                }
-                            ),
-                            html.P(
-                                "This is your beautiful site dashboard! Here you'll be able to view all the operational data, "
-                                "analytics, and insights for this location. The dashboard will be fully integrated with the "
-                                "weighbridge API to provide real-time data visualization.",
-                                style={
-                                    "color": "#A0AEC0",
-                                    "fontSize": "1.1rem",
-                                    "lineHeight": "1.6",
-                                    "maxWidth": "600px",
-                                    "margin": "0 auto"
-                                }
-                            )
-                        ]
-                    ),
-                    
-                    # Feature Cards Grid
-                    html.Div(
-                        className="features-grid",
-                        style={
-                            "display": "grid",
-                            "gridTemplateColumns": "repeat(auto-fit, minmax(280px, 1fr))",
-                            "gap": "1.5rem",
-                            "marginBottom": "2rem"
-                        },
-                        children=[
-                            # Card 1: Real-time Data
-                            create_feature_card(
-                                "📊",
-                                "Real-time Monitoring",
-                                "Live updates from weighbridge operations with instant data synchronization.",
-                                "#eb9534"
-                            ),
-                            
-                            # Card 2: Analytics
-                            create_feature_card(
-                                "📈",
-                                "Advanced Analytics",
-                                "Deep insights into operational patterns, trends, and performance metrics.",
-                                "#38A169"
-                            ),
-                            
-                            # Card 3: Reports
-                            create_feature_card(
-                                "📋",
-                                "Smart Reports",
-                                "Automated report generation with customizable views and export options.",
-                                "#DD6B20"
-                            ),
-                            
-                            # Card 4: Integration
-                            create_feature_card(
-                                "🔗",
-                                "API Integration",
-                                "Seamlessly connected to weighbridge systems for unified data management.",
-                                "#E53E3E"
-                            )
-                        ]
+                        className="sd-welcome",
+                        children=(
+                            _STATIC_WELCOME_ICON,
+                            _welcome_h2_for_site(site_name),
+                            _STATIC_WELCOME_TEXT
+                        )
                     ),
-                    
+
+                    # Feature Cards Grid - fully static, shared across builds
+                    _STATIC_FEATURES_GRID,
+
                     # Status Section
                     html.Div(
-                        style={
-                            "backgroundColor": "#2D3748",
-                            "borderRadius": "12px",
-                            "padding": "2rem",
-                            "border": "1px solid #1A1F2E",
-                            "textAlign": "center",
-                            "marginBottom": "3rem"
-                        },
-                        children=[
-                            html.H3(
-                                "🚀 Dashboard Status",
-                                style={
-                                    "color": "#FFFFFF",
-                                    "fontSize": "1.5rem",
-                                    "marginBottom": "1rem"
-                                }
-                            ),
+                        className="sd-status-section",
+                        children=(
+                            _STATIC_STATUS_H3,
                             html.Div(
-                                style={"display": "flex", "justifyContent": "center", "gap": "2rem", "flexWrap": "wrap"},
-                                children=[
-                                    create_status_item("✅", "System Status", "Online"),
-                                    create_status_item("📡", "API Connection", "Connected"),
-                                    create_status_item("🔄", "Last Update", "Just now"),
-                                    create_status_item("📍", "Location", site_name)
-                                ]
+                                className="sd-status-row",
+                                children=(
+                                    *_STATIC_STATUS_ITEMS,
+                                    _location_item_for_site(site_name)
+                                )
                             )
-                        ]
+                        )
                     )
-                ]
+                )
             )
-        ]
+        )
+    )
+
+# Derived strings - sites are bounded and repeated, so the formatted
+# titles are memoized rather than re-built per call
+@functools.lru_cache(maxsize=64)
+def _title_for(site_name):
+    """Header title string for one site"""
+    return f"🏢 {site_name} Dashboard"
+
+
+@functools.lru_cache(maxsize=64)
+def _welcome_for(site_name):
+    """Welcome heading string for one site"""
+    return f"Welcome to {site_name}"
+
+
+# Per-site dynamic fragments - the only nodes that vary between sites.
+# Caching them means repeat selections of the same site get pointer-equal
+# children, which React's reconciliation short-circuits on.
+@functools.lru_cache(maxsize=128)
+def _h1_for_site(site_name):
+    """Header title for one site, built once per unique site"""
+    return html.H1(
+        _title_for(site_name),
+        id="site-dashboard-h1",
+        className="sd-h1"
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _welcome_h2_for_site(site_name):
+    """Welcome heading for one site, built once per unique site"""
+    return html.H2(
+        _welcome_for(site_name),
+        id="site-dashboard-welcome-h2",
+        className="sd-welcome-h2"
     )
 
+
+@functools.lru_cache(maxsize=128)
+def _location_item_for_site(site_name):
+    """Location status item for one site, built once per unique site"""
+    return create_status_item("📍", "Location", site_name,
+                              value_id="site-dashboard-location-value")
+
+
+# The four accent colors are fixed, so their inline style dicts are
+# precomputed - the hot path is a dict lookup, not string formatting
+_ACCENT_STYLES = {
+    color: {"borderColor": f"{color}20", "--accent": color}
+    for color in ("#eb9534", "#38A169", "#DD6B20", "#E53E3E")
+}
+
+
+@functools.lru_cache(maxsize=32)
 def create_feature_card(icon, title, description, accent_color):
-    """Create a feature card with consistent styling"""
+    """Create a feature card with consistent styling
+
+    Arguments are all constant strings, so the built tree is memoized -
+    repeat dashboard builds reuse the same card instances. Only the
+    accent color stays inline, as a border color plus the --accent
+    custom property that drives the accent bar.
+    """
     return html.Div(
-        style={
-            "backgroundColor": "#2D3748",
-            "borderRadius": "12px",
-            "padding": "1.5rem",
-            "border": f"2px solid {accent_color}20",
-            "boxShadow": "0 4px 15px rgba(0, 0, 0, 0.1)",
-            "transition": "all 0.3s ease",
-            "position": "relative",
-            "overflow": "hidden"
-        },
-        children=[
+        className="sd-feature-card",
+        style=_ACCENT_STYLES.get(accent_color) or {"borderColor": f"{accent_color}20", "--accent": accent_color},
+        children=(
             # Accent line
-            html.Div(
-                style={
-                    "position": "absolute",
-                    "top": "0",
-                    "left": "0",
-                    "right": "0",
-                    "height": "4px",
-                    "background": accent_color
-                }
-            ),
-            html.Div(icon, style={"fontSize": "2.5rem", "marginBottom": "1rem"}),
-            html.H4(
-                title,
-                style={
-                    "color": "#FFFFFF",
-                    "fontSize": "1.3rem",
-                    "fontWeight": "600",
-                    "marginBottom": "0.5rem"
-                }
-            ),
-            html.P(
-                description,
-                style={
-                    "color": "#A0AEC0",
-                    "fontSize": "0.95rem",
-                    "lineHeight": "1.5",
-                    "margin": "0"
-                }
-            )
-        ]
+            html.Div(className="sd-feature-accent"),
+            html.Div(icon, className="sd-feature-icon"),
+            html.H4(title, className="sd-feature-title"),
+            html.P(description, className="sd-feature-desc")
+        )
     )
 
-def create_status_item(icon, label, value):
-    """Create a status item with icon, label, and value"""
+def create_status_item(icon, label, value, value_id=None):
+    """Create a status item with icon, label, and value
+
+    value_id gives the value node a stable component id so callbacks can
+    patch just that string instead of swapping the whole layout.
+    """
+    value_kwargs = {'id': value_id} if value_id else {}
     return html.Div(
-        style={"textAlign": "center"},
-        children=[
-            html.Div(icon, style={"fontSize": "1.5rem", "marginBottom": "0.5rem"}),
-            html.Div(label, style={
-                "color": "#A0AEC0", 
-                "fontSize": "0.8rem",
-                "fontWeight": "500"
-            }),
-            html.Div(value, style={
-                "color": "#FFFFFF", 
-                "fontSize": "1rem",
-                "fontWeight": "600"
-            })
-        ]
-    )
\ No newline at end of file
+        className="sd-status-item",
+        children=(
+            html.Div(icon, className="sd-status-icon"),
+            html.Div(label, className="sd-status-label"),
+            html.Div(value, className="sd-status-value", **value_kwargs)
+        )
+    )
+
+# Static template fragments - the skeleton is 98% constant, so every
+# branch that doesn't carry the site name is built once here and spliced
+# into each layout build
+_STATIC_CSS_LINK = html.Link(rel="stylesheet", href=_SITE_DASHBOARD_CSS_HREF)
+
+_STATIC_SUBTITLE = html.P(
+    "Real-time operations and analytics dashboard",
+    className="sd-subtitle"
+)
+
+# Navigation back to Magic View
+_STATIC_BACK_BTN = html.Button(
+    (html.Span("← "), "Back to Magic View"),
+    id="back-to-magic-view-btn",
+    className="sd-back-btn"
+)
+
+_STATIC_WELCOME_ICON = html.Div("🌟", className="sd-welcome-icon")
+
+_STATIC_WELCOME_TEXT = html.P(
+    "This is your beautiful site dashboard! Here you'll be able to view all the operational data, "
+    "analytics, and insights for this location. The dashboard will be fully integrated with the "
+    "weighbridge API to provide real-time data visualization.",
+    className="sd-welcome-text"
+)
+
+_STATIC_FEATURES_GRID = html.Div(
+    className="features-grid sd-grid",
+    children=(
+        create_feature_card(
+            "📊",
+            "Real-time Monitoring",
+            "Live updates from weighbridge operations with instant data synchronization.",
+            "#eb9534"
+        ),
+        create_feature_card(
+            "📈",
+            "Advanced Analytics",
+            "Deep insights into operational patterns, trends, and performance metrics.",
+            "#38A169"
+        ),
+        create_feature_card(
+            "📋",
+            "Smart Reports",
+            "Automated report generation with customizable views and export options.",
+            "#DD6B20"
+        ),
+        create_feature_card(
+            "🔗",
+            "API Integration",
+            "Seamlessly connected to weighbridge systems for unified data management.",
+            "#E53E3E"
+        )
+    )
+)
+
+_STATIC_STATUS_H3 = html.H3("🚀 Dashboard Status", className="sd-status-h3")
+
+# The first three status items never vary - build them once at import.
+# Only the location item depends on site_name.
+_STATIC_STATUS_ITEMS = (
+    create_status_item("✅", "System Status", "Online"),
+    create_status_item("📡", "API Connection", "Connected"),
+    create_status_item("🔄", "Last Update", "Just now")
+)
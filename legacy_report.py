@@ -5,6 +5,7 @@ Matches the public landing page style with minimalistic UI
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -199,10 +200,10 @@ def load_waste_data():
         
         # Load the actual data
         df = get_cached_data()
-        
+
         if not df.empty:
             st.sidebar.success(f"✅ Loaded {len(df):,} records")
-            return df
+            return _encode_categoricals(df)
         else:
             st.sidebar.warning("No data in CSV files")
             return create_sample_data()
@@ -214,6 +215,32 @@ def load_waste_data():
         st.sidebar.error(f"Error loading data: {e}")
         return create_sample_data()
 
+def _encode_categoricals(df):
+    """Dictionary-encode the low-cardinality string columns
+
+    The filter predicates and groupbys all run on these columns; as
+    category dtype the comparisons are small-int compares against a
+    shared dictionary instead of per-row string hashing, and the columns
+    shrink from ~50 B/row of python objects to one code per row.
+    """
+    df = df.copy(deep=False)
+    for column in ('agency', 'cluster', 'site', 'vehicle', 'waste_type'):
+        if column in df.columns and df[column].dtype != 'category':
+            df[column] = df[column].astype('category')
+
+    # Weights are grams well inside int32 range; halving the column
+    # width halves the memory traffic of every sum/mean over it
+    if 'weight' in df.columns:
+        df['weight'] = pd.to_numeric(df['weight'], downcast='integer')
+        df['weight_tons'] = (df['weight'] / 1000).astype('float32')
+
+    # Date-sorted frame turns the date-range filter into a binary-search
+    # slice (see apply_filters); stable sort keeps same-day row order
+    if 'Date' in df.columns and not df['Date'].is_monotonic_increasing:
+        df = df.sort_values('Date', kind='stable').reset_index(drop=True)
+    return df
+
+
 def create_sample_data():
     """Create sample data if real data not available"""
     sample_data = [
@@ -227,12 +254,15 @@ def create_sample_data():
          "weight": 26800, "vehicle": "AP16DB9087", "time": "13:45:00", "waste_type": "MSW"},
         {"Date": "2025-08-18", "agency": "tirupati", "site": "tirupati", "cluster": "TTD", 
          "weight": 14200, "vehicle": "AP07RB2398", "time": "07:30:00", "waste_type": "MSW"},
-    ] * 50  # Multiply to create more sample data
-    
-    df = pd.DataFrame(sample_data)
+    ]
+
+    # Replicate the 5 base rows 50x with a vectorized take instead of
+    # multiplying the python list and re-parsing 250 dicts
+    base = pd.DataFrame(sample_data)
+    df = base.iloc[np.tile(np.arange(len(base)), 50)].reset_index(drop=True)
     df['Date'] = pd.to_datetime(df['Date'])
     df['weight_tons'] = df['weight'] / 1000
-    return df
+    return _encode_categoricals(df)
 
 def create_summary_metrics(df):
     """Create summary metrics cards matching your dashboard style"""
@@ -284,16 +314,32 @@ def create_summary_metrics(df):
             delta="Per record"
         )
 
+@st.cache_data(show_spinner=False)
+def _sidebar_choices(df):
+    """Unique sorted choices for every filter selectbox, computed once
+
+    Every Streamlit rerun rebuilds the sidebar; without the cache that
+    meant four full column scans plus four sorts per interaction.
+    st.cache_data keys on the frame contents, so the lists are reused
+    until the data actually changes.
+    """
+    return {
+        column: ['All'] + sorted(df[column].unique().tolist())
+        if column in df.columns else ['All']
+        for column in ('agency', 'cluster', 'site', 'vehicle')
+    }
+
+
 def create_filters_sidebar(df):
     """Create filters in sidebar matching your style"""
     st.sidebar.header("🔧 Data Filters")
     st.sidebar.markdown("---")
-    
+
     # Date range filter
     if 'Date' in df.columns and not df.empty:
         min_date = df['Date'].min().date()
         max_date = df['Date'].max().date()
-        
+
         date_range = st.sidebar.date_input(
             "📅 Date Range",
             value=(min_date, max_date),
@@ -302,23 +348,13 @@ def create_filters_sidebar(df):
         )
     else:
         date_range = None
-    
-    # Agency filter
-    agencies = ['All'] + sorted(df['agency'].unique().tolist()) if 'agency' in df.columns else ['All']
-    selected_agency = st.sidebar.selectbox("🏢 Agency", agencies)
-    
-    # Cluster filter
-    clusters = ['All'] + sorted(df['cluster'].unique().tolist()) if 'cluster' in df.columns else ['All']
-    selected_cluster = st.sidebar.selectbox("🌐 Cluster", clusters)
-    
-    # Site filter
-    sites = ['All'] + sorted(df['site'].unique().tolist()) if 'site' in df.columns else ['All']
-    selected_site = st.sidebar.selectbox("📍 Site", sites)
-    
-    # Vehicle filter
-    vehicles = ['All'] + sorted(df['vehicle'].unique().tolist()) if 'vehicle' in df.columns else ['All']
-    selected_vehicle = st.sidebar.selectbox("🚛 Vehicle", vehicles)
-    
+
+    choices = _sidebar_choices(df)
+    selected_agency = st.sidebar.selectbox("🏢 Agency", choices['agency'])
+    selected_cluster = st.sidebar.selectbox("🌐 Cluster", choices['cluster'])
+    selected_site = st.sidebar.selectbox("📍 Site", choices['site'])
+    selected_vehicle = st.sidebar.selectbox("🚛 Vehicle", choices['vehicle'])
+
     return {
         'date_range': date_range,
         'agency': selected_agency,
@@ -328,95 +364,149 @@ def create_filters_sidebar(df):
     }
 
 def apply_filters(df, filters):
-    """Apply filters to dataframe"""
+    """Apply filters to dataframe
+
+    Builds one combined boolean mask and slices the frame exactly once -
+    the previous chain of per-filter slices allocated a full intermediate
+    DataFrame per active filter.
+    """
     if df.empty:
         return df
-    
-    filtered_df = df.copy()
-    
-    # Date filter
-    if filters['date_range'] and len(filters['date_range']) == 2:
+
+    masks = []
+
+    # Date filter - on the date-sorted frame the range is a binary-search
+    # slice; otherwise compare at day resolution without materializing a
+    # python date object per row
+    if filters['date_range'] and len(filters['date_range']) == 2 and 'Date' in df.columns:
         start_date, end_date = filters['date_range']
-        if 'Date' in filtered_df.columns:
-            filtered_df = filtered_df[
-                (filtered_df['Date'].dt.date >= start_date) & 
-                (filtered_df['Date'].dt.date <= end_date)
-            ]
-    
-    # Agency filter
-    if filters['agency'] != 'All' and 'agency' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['agency'] == filters['agency']]
-    
-    # Cluster filter
-    if filters['cluster'] != 'All' and 'cluster' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['cluster'] == filters['cluster']]
-    
-    # Site filter
-    if filters['site'] != 'All' and 'site' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['site'] == filters['site']]
-    
-    # Vehicle filter
-    if filters['vehicle'] != 'All' and 'vehicle' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['vehicle'] == filters['vehicle']]
-    
-    return filtered_df
+        if df['Date'].is_monotonic_increasing:
+            dates = df['Date'].values
+            lo = np.searchsorted(dates, np.datetime64(start_date), side='left')
+            hi = np.searchsorted(dates, np.datetime64(end_date) + np.timedelta64(1, 'D'), side='left')
+            df = df.iloc[lo:hi]
+            if df.empty:
+                return df
+        else:
+            days = df['Date'].values.astype('datetime64[D]')
+            masks.append(days >= np.datetime64(start_date))
+            masks.append(days <= np.datetime64(end_date))
+
+    # Equality filters
+    for column in ('agency', 'cluster', 'site', 'vehicle'):
+        if filters[column] != 'All' and column in df.columns:
+            masks.append((df[column] == filters[column]).values)
+
+    if not masks:
+        return df
+
+    return df.loc[np.logical_and.reduce(masks)]
+
+@st.cache_resource(max_entries=32)
+def _daily_trend_fig(day_keys, tons):
+    """Line figure for the daily trend, cached per aggregated series
+
+    Figure construction and serialization dominate chart cost on rerun;
+    keying on the (tiny) aggregated tuples means unchanged filters reuse
+    the same figure object.
+    """
+    daily_data = pd.DataFrame({
+        'Date': pd.to_datetime(np.asarray(day_keys, dtype='datetime64[D]')),
+        'weight_tons': tons
+    })
+    fig_line = px.line(
+        daily_data,
+        x='Date',
+        y='weight_tons',
+        title="Daily Waste Collection (Tons)",
+        color_discrete_sequence=['#eb9534']
+    )
+    fig_line.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(45,55,72,1)',
+        font_color='white',
+        title_font_color='#eb9534'
+    )
+    return fig_line
+
+
+@st.cache_resource(max_entries=32)
+def _agency_totals_fig(agencies, tons):
+    """Horizontal bar figure for agency totals, cached per aggregated series"""
+    agency_data = pd.DataFrame({'agency': agencies, 'weight_tons': tons})
+    # Discrete four-bin palette: same low-to-high color story as the old
+    # continuous scale without per-bar color interpolation in the client
+    agency_data['tier'] = pd.cut(agency_data['weight_tons'], bins=4,
+                                 labels=['low', 'med', 'high', 'top'])
+    fig_bar = px.bar(
+        agency_data,
+        x='weight_tons',
+        y='agency',
+        orientation='h',
+        title="Total Waste by Agency (Tons)",
+        color='tier',
+        color_discrete_map={'low': '#E53E3E', 'med': '#DD6B20',
+                            'high': '#eb9534', 'top': '#38A169'}
+    )
+    fig_bar.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(45,55,72,1)',
+        font_color='white',
+        title_font_color='#eb9534',
+        showlegend=False
+    )
+    return fig_bar
+
 
 def create_data_visualizations(df):
     """Create charts matching your theme"""
     if df.empty:
         st.warning("No data available for visualization")
         return
-    
+
     col1, col2 = st.columns(2)
-    
+
+    # One fused (day, agency) aggregation feeds both charts; the per-axis
+    # totals then reduce the small grouped series instead of rescanning
+    # the weight column twice. Days are bucketed as datetime64[D] so the
+    # groupby hashes int64 days, not a python date object per row.
+    daily = by_agency = None
+    if 'Date' in df.columns and 'agency' in df.columns and 'weight' in df.columns:
+        days = df['Date'].values.astype('datetime64[D]')
+        # observed=True: with agency as a categorical, don't emit
+        # zero groups for agencies filtered out of the frame
+        g = df['weight'].groupby([days, df['agency']], observed=True).sum()
+        daily = g.groupby(level=0).sum()
+        by_agency = g.groupby(level=1, observed=True).sum().sort_values(ascending=True)
+    elif 'Date' in df.columns and 'weight' in df.columns:
+        daily = df['weight'].groupby(df['Date'].values.astype('datetime64[D]')).sum()
+
     with col1:
         st.subheader("📈 Daily Collection Trends")
-        
-        # Group by date
-        if 'Date' in df.columns and 'weight' in df.columns:
-            daily_data = df.groupby(df['Date'].dt.date)['weight'].sum().reset_index()
-            daily_data['weight_tons'] = daily_data['weight'] / 1000
-            
-            fig_line = px.line(
-                daily_data, 
-                x='Date', 
-                y='weight_tons',
-                title="Daily Waste Collection (Tons)",
-                color_discrete_sequence=['#eb9534']
-            )
-            fig_line.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(45,55,72,1)',
-                font_color='white',
-                title_font_color='#eb9534'
+
+        if daily is not None:
+            fig_line = _daily_trend_fig(
+                tuple(np.asarray(daily.index, dtype='datetime64[D]').view('i8').tolist()),
+                tuple((daily / 1000).tolist())
             )
             st.plotly_chart(fig_line, use_container_width=True)
-    
+
     with col2:
         st.subheader("🏢 Collection by Agency")
-        
-        if 'agency' in df.columns and 'weight' in df.columns:
-            agency_data = df.groupby('agency')['weight'].sum().reset_index()
-            agency_data['weight_tons'] = agency_data['weight'] / 1000
-            agency_data = agency_data.sort_values('weight_tons', ascending=True)
-            
-            fig_bar = px.bar(
-                agency_data, 
-                x='weight_tons',
-                y='agency',
-                orientation='h',
-                title="Total Waste by Agency (Tons)",
-                color='weight_tons',
-                color_continuous_scale=['#E53E3E', '#DD6B20', '#eb9534', '#38A169']
-            )
-            fig_bar.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(45,55,72,1)',
-                font_color='white',
-                title_font_color='#eb9534'
+
+        if by_agency is not None:
+            fig_bar = _agency_totals_fig(
+                tuple(str(a) for a in by_agency.index),
+                tuple((by_agency / 1000).tolist())
             )
             st.plotly_chart(fig_bar, use_container_width=True)
 
+@st.cache_data(show_spinner=False)
+def _csv_export_bytes(df):
+    """Encoded CSV of the filtered frame, rebuilt only when it changes"""
+    return df.to_csv(index=False).encode('utf-8')
+
+
 def display_data_table(df, filters):
     """Display data table with your styling"""
     st.subheader("📋 Waste Management Records")
@@ -436,33 +526,39 @@ def display_data_table(df, filters):
         )
     
     with col2:
-        if st.button("📊 Export CSV", use_container_width=True):
-            csv = df.to_csv(index=False)
-            st.download_button(
-                label="💾 Download",
-                data=csv,
-                file_name=f"waste_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
+        # One-click download; the CSV bytes are cached per frame so
+        # reruns don't rebuild the full string
+        st.download_button(
+            label="📊 Export CSV",
+            data=_csv_export_bytes(df),
+            file_name=f"waste_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
     
     with col3:
         if st.button("🔄 Refresh", use_container_width=True):
-            st.cache_data.clear()
+            # Invalidate only the data load - the sidebar-choice, CSV and
+            # figure caches rebuild themselves if the data truly changed.
+            # Bumping the generation invalidates the filter memo too.
+            load_waste_data.clear()
+            st.session_state['_data_generation'] = st.session_state.get('_data_generation', 0) + 1
             st.experimental_rerun()
     
     with col4:
         show_details = st.checkbox("Show Details", value=False)
     
-    # Prepare display dataframe
-    display_df = df.copy()
-    
+    # Prepare display dataframe - slice first, then shallow-copy so the
+    # formatting below only allocates the handful of displayed rows
     if records_to_show != "All":
-        display_df = display_df.head(int(records_to_show))
-    
-    # Format for display
+        display_df = df.head(int(records_to_show)).copy(deep=False)
+    else:
+        display_df = df.copy(deep=False)
+
+    # Format for display - datetime64[D] -> str renders the ISO date in
+    # C instead of per-row python strftime calls
     if 'Date' in display_df.columns:
-        display_df['Date'] = display_df['Date'].dt.strftime('%Y-%m-%d')
+        display_df['Date'] = display_df['Date'].values.astype('datetime64[D]').astype(str)
     
     if 'weight' in display_df.columns:
         display_df['Weight (tons)'] = (display_df['weight'] / 1000).round(2)
@@ -486,6 +582,31 @@ def display_data_table(df, filters):
     # Show summary
     st.info(f"📊 Showing {len(display_df):,} of {len(df):,} records")
 
+def _filtered_frame(df, filters):
+    """apply_filters memoized on (data generation, filter signature)
+
+    Streamlit reruns the whole script on any widget interaction, so e.g.
+    toggling 'Show Details' re-filtered the frame with identical
+    filters. The last result is kept in session state and reused while
+    the filter values and the data generation are unchanged. The
+    generation counter stands in for the source frame's identity:
+    st.cache_data hands back a fresh copy of the frame on every rerun,
+    so an `is` check on df itself would never match. The Refresh button
+    bumps the counter when it clears load_waste_data.
+    """
+    key = (st.session_state.get('_data_generation', 0),
+           filters['date_range'], filters['agency'], filters['cluster'],
+           filters['site'], filters['vehicle'])
+    state = st.session_state
+    if state.get('_last_filter_key') == key:
+        return state['_last_filtered']
+
+    filtered_df = apply_filters(df, filters)
+    state['_last_filter_key'] = key
+    state['_last_filtered'] = filtered_df
+    return filtered_df
+
+
 def main():
     """Main Streamlit application"""
     
@@ -502,9 +623,9 @@ def main():
     
     # Sidebar filters
     filters = create_filters_sidebar(df)
-    
-    # Apply filters
-    filtered_df = apply_filters(df, filters)
+
+    # Apply filters (memoized across reruns with unchanged filters)
+    filtered_df = _filtered_frame(df, filters)
     
     # Show success message
     st.success("🎉 **Streamlit Integration Successful!** You've successfully logged in via Flask and reached the enhanced dashboard.")
@@ -5,10 +5,11 @@ DASHBOARD CODE MOVED TO admin_dashboard.py
 """
 
 import dash
-from dash import html, dcc, callback, Input, Output, State, ctx, clientside_callback
+from dash import html, dcc, callback, Input, Output, State, ctx, clientside_callback, ALL
 from dash.exceptions import PreventUpdate
 import flask
 from flask import request, redirect, session
+import hashlib
 import urllib.parse
 import os
 import logging
@@ -80,6 +81,38 @@ except Exception as e:
 server = flask.Flask(__name__)
 server.secret_key = 'your-secret-key-change-this-in-production'
 
+
+def _minified_css(href):
+    """Prefer the deploy-time .min.css (see minify_assets.py) when it exists"""
+    min_href = href[:-len('.css')] + '.min.css'
+    if os.path.exists(min_href.lstrip('/')):
+        return min_href
+    return href
+
+
+@server.after_request
+def _serve_precompressed_css(response):
+    """Serve the precompressed .css.br/.css.gz sibling produced at deploy time
+
+    minify_assets.py writes both siblings; brotli is preferred when the
+    client accepts it (~15-20% smaller than gzip on these stylesheets).
+    """
+    path = flask.request.path
+    if path.endswith('.css') and response.status_code == 200:
+        accepted = flask.request.headers.get('Accept-Encoding', '')
+        for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+            if encoding not in accepted:
+                continue
+            compressed_file = path.lstrip('/') + suffix
+            if os.path.exists(compressed_file):
+                with open(compressed_file, 'rb') as f:
+                    response.set_data(f.read())
+                response.headers['Content-Encoding'] = encoding
+                response.headers['Content-Length'] = len(response.get_data())
+                response.headers['Vary'] = 'Accept-Encoding'
+                break
+    return response
+
 # Enhanced session configuration
 server.config.update(
     SESSION_COOKIE_SECURE=False,  # Set to True in production with HTTPS
@@ -89,16 +122,20 @@ server.config.update(
 )
 
 app = dash.Dash(
-    __name__, 
+    __name__,
     server=server,
-    suppress_callback_exceptions=True, 
+    suppress_callback_exceptions=True,
     title="Swachha Andhra  Dashboard",
+    # Page-specific stylesheets are linked lazily by their own layouts
+    # (public dashboard / admin dashboard) instead of shipping on every route
+    # .min.css artifacts are referenced explicitly below, never auto-injected
+    assets_ignore=r'(uniform_cards|container_zoom_fix|admin_dashboard_pages|site_dashboard|upload_layout)\.css|\.min\.css$',
     external_stylesheets=[
         "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap",
-        "/assets/dashboard.css",                    # This works (200/304)
-        "/assets/dashboard_filters.css",            # This works (304)
-        "/assets/style.css",                        # This works (304)
-        "/assets/css/public_layout_consolidated.css" # This works (304)
+        _minified_css("/assets/dashboard.css"),                    # This works (200/304)
+        _minified_css("/assets/dashboard_filters.css"),            # This works (304)
+        _minified_css("/assets/style.css"),                        # This works (304)
+        _minified_css("/assets/css/public_layout_consolidated.css") # This works (304)
     ],
     meta_tags=[
         {"name": "viewport", "content": "width=device-width, initial-scale=1.0"},
@@ -117,6 +154,14 @@ app.index_string = f'''
         {{%favicon%}}
         {{%css%}}
         <link rel="manifest" href="/assets/manifest.json">
+        <script>
+            // Theme palette table - fetched once and cached by the
+            // browser (ETag/304) instead of shipping inline on every
+            // page load. Consumed by the theme clientside callback.
+            fetch('/assets/themes.json')
+                .then(function(r) {{ return r.json(); }})
+                .then(function(t) {{ window.THEMES = t; }});
+        </script>
         <style>
             {get_hover_overlay_css()}
             
@@ -302,7 +347,7 @@ def register_custom_dashboard_routes(server):
                 for cluster, sites in grouped.items():
                     cluster_sites[cluster] = list(sites)
             
-            logger.info(f"✅ CSV relationships: {len(agency_clusters)} agencies, {len(cluster_sites)} clusters")
+            logger.info("✅ CSV relationships: %d agencies, %d clusters", len(agency_clusters), len(cluster_sites))
             
             return flask.jsonify({
                 'agency_clusters': agency_clusters,
@@ -324,15 +369,25 @@ def register_custom_dashboard_routes(server):
             return {'error': 'Authentication required'}, 401
         
         try:
-            from data_loader import get_cached_data, filter_data
-            
+            from data_loader import get_cached_data, get_data_version, get_filter_stats
+
             # Get filter parameters from request
             agency = request.args.get('agency', 'all')
             cluster = request.args.get('cluster', 'all')
             site = request.args.get('site', 'all')
             start_date = request.args.get('start_date')
             end_date = request.args.get('end_date')
-            
+
+            # The response is fully determined by (data version, filters),
+            # so a matching ETag means the client's copy is still valid -
+            # answer 304 before touching the data at all
+            etag = hashlib.blake2s(
+                f"{get_data_version()}|{agency}|{cluster}|{site}|{start_date}|{end_date}".encode(),
+                digest_size=8
+            ).hexdigest()
+            if request.if_none_match.contains(etag):
+                return '', 304
+
             # Load and filter CSV data
             df = get_cached_data()
             
@@ -342,26 +397,12 @@ def register_custom_dashboard_routes(server):
                     "message": "Please upload a CSV file"
                 })
             
-            # Apply filters
-            filtered_df = filter_data(df, agency, cluster, site, start_date, end_date)
-            
-            # Calculate statistics using correct column names from your CSV
-            record_count = len(filtered_df)
-            
-            # Use 'Net Weight' column (as per your CSV structure)
-            total_weight = 0
-            if 'Net Weight' in filtered_df.columns and not filtered_df.empty:
-                total_weight = filtered_df['Net Weight'].sum()
-            elif 'weight' in filtered_df.columns and not filtered_df.empty:
-                total_weight = filtered_df['weight'].sum()
-            
-            # Use 'Vehicle No' column (as per your CSV structure)
-            vehicle_count = 0
-            if 'Vehicle No' in filtered_df.columns and not filtered_df.empty:
-                vehicle_count = filtered_df['Vehicle No'].nunique()
-            elif 'vehicle' in filtered_df.columns and not filtered_df.empty:
-                vehicle_count = filtered_df['vehicle'].nunique()
-            
+            # Filter + aggregate in one fused pass, memoized per filter
+            # key - repeat dropdown selections collapse to a dict lookup
+            record_count, total_weight, vehicle_count = get_filter_stats(
+                agency, cluster, site, start_date, end_date
+            )
+
             filter_response = {
                 "agency": agency,
                 "cluster": cluster,
@@ -369,16 +410,24 @@ def register_custom_dashboard_routes(server):
                 "start_date": start_date,
                 "end_date": end_date,
                 "record_count": record_count,
-                "total_weight": f"{total_weight:,.0f} kg",
+                # Raw number - the browser formats it (toLocaleString),
+                # which keeps the value machine-readable and skips the
+                # per-request grouping f-string on the server
+                "total_weight_kg": total_weight,
                 "vehicle_count": vehicle_count,
                 "timestamp": time.time(),
                 "source": "CSV Data with Cascading Filters",
                 "total_records_available": len(df)
             }
             
-            logger.info(f"✅ Filtered CSV data: {record_count} records from {len(df)} total")
-            
-            return flask.jsonify(filter_response)
+            logger.info("✅ Filtered CSV data: %d records from %d total", record_count, len(df))
+
+            response = flask.jsonify(filter_response)
+            response.set_etag(etag)
+            # Polling clients can reuse the body for 30s, then revalidate
+            # with If-None-Match and usually get an empty 304 back
+            response.headers['Cache-Control'] = 'private, max-age=30'
+            return response
             
         except Exception as e:
             logger.error(f"❌ Error filtering CSV data: {e}")
@@ -391,43 +440,35 @@ def register_custom_dashboard_routes(server):
 
 @callback(
     Output('current-theme', 'data'),
-    [
-        Input('theme-dark', 'n_clicks'),
-        Input('theme-light', 'n_clicks'),
-        Input('theme-high_contrast', 'n_clicks'),
-        Input('theme-swaccha_green', 'n_clicks')
-    ],
+    Input({'type': 'theme-btn', 'name': ALL}, 'n_clicks'),
     [State('current-theme', 'data')],  # Add current theme as state
     prevent_initial_call=True
 )
-def update_theme_with_session_sync(dark_clicks, light_clicks, contrast_clicks, green_clicks, current_theme):
+def update_theme_with_session_sync(theme_clicks, current_theme):
     """
     Handle theme switching from overlay banner with Flask session synchronization
     FIXED: Prevents reset to dark theme
+
+    One pattern-matching input covers every theme button; the theme name
+    comes straight from the triggering id instead of a prop_id lookup
+    table, so adding a theme needs no callback change.
     """
     if not ctx.triggered:
         return current_theme or DEFAULT_THEME  # Return current theme instead of default
-    
+
     # Check if any button was actually clicked (not just initialized)
     triggered_prop = ctx.triggered[0]
     if triggered_prop['value'] is None or triggered_prop['value'] == 0:
         return current_theme or DEFAULT_THEME
-    
-    button_id = triggered_prop['prop_id'].split('.')[0]
-    theme_map = {
-        'theme-dark': 'dark',
-        'theme-light': 'light', 
-        'theme-high_contrast': 'high_contrast',
-        'theme-swaccha_green': 'swaccha_green'
-    }
-    
-    new_theme = theme_map.get(button_id, current_theme or DEFAULT_THEME)
-    
+
+    triggered_id = ctx.triggered_id
+    new_theme = (triggered_id or {}).get('name') or current_theme or DEFAULT_THEME
+
     # Only update if it's actually different
     if new_theme != current_theme:
         try:
             session['current_theme'] = new_theme
-            logger.info(f"Theme successfully changed: {current_theme} → {new_theme}")
+            logger.info("Theme successfully changed: %s → %s", current_theme, new_theme)
         except Exception as e:
             logger.warning(f"Could not sync theme to Flask session: {e}")
     
@@ -437,87 +478,20 @@ clientside_callback(
     """
     function(theme_name) {
         if (!theme_name) return window.dash_clientside.no_update;
-        
-        console.log('🎨 Updating theme to:', theme_name);
-        
-        // Define theme colors - COMPLETE THEME DEFINITIONS
-        const themes = {
-            'dark': {
-                '--primary-bg': '#0D1B2A',
-                '--secondary-bg': '#1B263B', 
-                '--accent-bg': '#415A77',
-                '--card-bg': '#1B263B',
-                '--text-primary': '#E0E1DD',
-                '--text-secondary': '#778DA9',
-                '--brand-primary': '#3182CE',
-                '--border-light': '#415A77',
-                '--success': '#38A169',
-                '--warning': '#DD6B20', 
-                '--error': '#E53E3E',
-                '--info': '#3182CE'
-            },
-            'light': {
-                '--primary-bg': '#FFFFFF',
-                '--secondary-bg': '#F8F9FA',
-                '--accent-bg': '#E2E8F0', 
-                '--card-bg': '#FFFFFF',
-                '--text-primary': '#2D3748',
-                '--text-secondary': '#4A5568',
-                '--brand-primary': '#3182CE',
-                '--border-light': '#E2E8F0',
-                '--success': '#38A169',
-                '--warning': '#DD6B20',
-                '--error': '#E53E3E', 
-                '--info': '#3182CE'
-            },
-            'high_contrast': {
-                '--primary-bg': '#000000',
-                '--secondary-bg': '#1A1A1A',
-                '--accent-bg': '#333333',
-                '--card-bg': '#1A1A1A', 
-                '--text-primary': '#FFFFFF',
-                '--text-secondary': '#CCCCCC',
-                '--brand-primary': '#FFFF00',
-                '--border-light': '#333333',
-                '--success': '#00FF00',
-                '--warning': '#FFA500',
-                '--error': '#FF0000',
-                '--info': '#FFFF00'
-            },
-            'swaccha_green': {
-                '--primary-bg': '#064E3B',
-                '--secondary-bg': '#065F46',
-                '--accent-bg': '#047857',
-                '--card-bg': '#065F46',
-                '--text-primary': '#ECFDF5', 
-                '--text-secondary': '#A7F3D0',
-                '--brand-primary': '#10B981',
-                '--border-light': '#047857',
-                '--success': '#10B981',
-                '--warning': '#F59E0B',
-                '--error': '#EF4444',
-                '--info': '#06B6D4'
-            }
-        };
-        
-        const themeVars = themes[theme_name];
+
+        // Palette table is preloaded from /assets/themes.json (see
+        // index_string) - browser-cached instead of inlined here
+        const themeVars = (window.THEMES || {})[theme_name];
         if (themeVars) {
             const root = document.documentElement;
-            
-            // Apply all CSS variables
-            Object.keys(themeVars).forEach(key => {
+            for (const key in themeVars) {
                 root.style.setProperty(key, themeVars[key]);
-            });
-            
-            console.log('✅ Theme CSS variables updated successfully');
-            
-            // Also update theme attribute on body for additional styling
+            }
             document.body.setAttribute('data-theme', theme_name);
-            
         } else {
-            console.warn('⚠️ Theme not found:', theme_name);
+            console.warn('\u26a0\ufe0f Theme not found:', theme_name);
         }
-        
+
         return window.dash_clientside.no_update;
     }
     """,
@@ -534,10 +508,10 @@ def handle_theme_change():
         data = request.get_json()
         if data and 'theme' in data:
             session['current_theme'] = data['theme']
-            return {{"status": "success", "theme": data['theme']}}
+            return {"status": "success", "theme": data['theme']}
     except:
         pass
-    return {{"status": "error"}}
+    return {"status": "error"}
 
 def generate_static_html_content(theme_name):
     """Generate static HTML version of your layout for faster loading"""
@@ -673,7 +647,7 @@ def oauth_login():
         from utils.simple_oauth import get_oauth_manager
         oauth_manager = get_oauth_manager()
         
-        logger.info(f"🔐 OAuth login attempt - configured: {oauth_manager.is_available()}")
+        logger.info("🔐 OAuth login attempt - configured: %s", oauth_manager.is_available())
         
         if not oauth_manager.is_available():
             logger.info("⚠️ OAuth not configured - creating demo session")
@@ -696,7 +670,7 @@ def oauth_login():
             flask.session['oauth_state'] = state
             flask.session['oauth_timestamp'] = time.time()
             
-            logger.info(f"🔗 Redirecting to Google OAuth: {auth_url[:100]}...")
+            logger.info("🔗 Redirecting to Google OAuth: %.100s...", auth_url)
             return redirect(auth_url)
             
         except Exception as e:
@@ -727,7 +701,7 @@ def oauth_callback():
         state = request.args.get('state')
         error = request.args.get('error')
         
-        logger.info(f"📥 OAuth callback - code: {'✅' if code else '❌'}, state: {'✅' if state else '❌'}, error: {error or 'None'}")
+        logger.info("📥 OAuth callback - code: %s, state: %s, error: %s", '✅' if code else '❌', '✅' if state else '❌', error or 'None')
         
         if error:
             logger.error(f"❌ OAuth error from Google: {error}")
@@ -760,7 +734,7 @@ def oauth_callback():
             return redirect('/login?error=user_info_failed')
         
         # Authenticate user
-        logger.info(f"🔐 Authenticating user: {user_info.get('email', 'unknown')}")
+        logger.info("🔐 Authenticating user: %s", user_info.get('email', 'unknown'))
         success, message, session_data = oauth_manager.authenticate_user(user_info)
         
         if success:
@@ -768,7 +742,7 @@ def oauth_callback():
             flask.session['swaccha_session_id'] = session_data['session_id']
             flask.session['user_data'] = session_data
             
-            logger.info(f"✅ OAuth login successful for: {user_info.get('email')}")
+            logger.info("✅ OAuth login successful for: %s", user_info.get('email'))
             return redirect('/dashboard')
         else:
             logger.warning(f"❌ User authorization failed: {message}")
@@ -787,7 +761,7 @@ def debug_oauth():
         
         oauth_manager = get_oauth_manager()
         debug_info = oauth_manager.get_debug_info()
-        
+
         # Additional system checks
         system_info = {
             'python_version': f"{__import__('sys').version_info.major}.{__import__('sys').version_info.minor}",
@@ -795,100 +769,16 @@ def debug_oauth():
             'cwd': os.getcwd(),
             'client_secrets_path': os.path.abspath('client_secrets.json') if os.path.exists('client_secrets.json') else 'Not found'
         }
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>🔧 OAuth Debug Center</title>
-            <style>
-                body {{ 
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; 
-                    margin: 0; padding: 0; background: #0D1B2A; color: #fff; 
-                }}
-                .container {{ max-width: 1200px; margin: 0 auto; padding: 40px 20px; }}
-                .header {{ text-align: center; margin-bottom: 40px; }}
-                .section {{ 
-                    margin: 30px 0; padding: 25px; background: #1A1F2E; 
-                    border-radius: 16px; border: 2px solid #3182CE; 
-                }}
-                .status {{ 
-                    padding: 15px; margin: 10px 0; border-radius: 10px; 
-                    display: flex; align-items: center; gap: 15px;
-                }}
-                .good {{ background: #2D5A31; border: 2px solid #38A169; }}
-                .bad {{ background: #5A2D2D; border: 2px solid #E53E3E; }}
-                .warning {{ background: #5A4D2D; border: 2px solid #DD6B20; }}
-                .icon {{ font-size: 24px; }}
-                .details {{ flex: 1; }}
-                .label {{ font-weight: 600; font-size: 16px; }}
-                .desc {{ font-size: 14px; opacity: 0.8; margin-top: 5px; }}
-                pre {{ 
-                    background: #000; padding: 20px; border-radius: 12px; 
-                    overflow-x: auto; font-size: 13px; line-height: 1.4;
-                }}
-                .btn {{ 
-                    display: inline-block; padding: 15px 30px; margin: 10px 5px; 
-                    background: #3182CE; color: white; text-decoration: none; 
-                    border-radius: 10px; font-weight: 600; transition: all 0.2s;
-                }}
-                .btn:hover {{ background: #2C5AA0; transform: translateY(-2px); }}
-                .btn.success {{ background: #38A169; }}
-                .btn.warning {{ background: #DD6B20; }}
-                h1, h2 {{ color: #3182CE; }}
-                .grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 20px; }}
-                @media (max-width: 768px) {{ .grid {{ grid-template-columns: 1fr; }} }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🔧 OAuth Debug Center</h1>
-                    <p>Complete OAuth configuration and testing dashboard</p>
-                </div>
-                
-                <div class="section">
-                    <h2>🚦 System Status</h2>
-                    
-                    <div class="status {'good' if debug_info.get('oauth_configured') else 'bad'}">
-                        <div class="icon">{'✅' if debug_info.get('oauth_configured') else '❌'}</div>
-                        <div class="details">
-                            <div class="label">OAuth Configuration</div>
-                            <div class="desc">
-                                {'Properly configured with client_secrets.json' if debug_info.get('oauth_configured') else 'Missing or invalid client_secrets.json file'}
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="grid">
-                    <div class="section">
-                        <h2>🧪 Quick Tests</h2>
-                        <a href="/oauth/login" class="btn success">🔗 Test OAuth Flow</a>
-                        <p><em>Tests the complete OAuth login process</em></p>
-                        
-                        <a href="/login" class="btn">📋 Login Page</a>
-                        <p><em>Go to the main login page</em></p>
-                        
-                        <a href="/" class="btn">🏠 Dashboard</a>
-                        <p><em>Return to main dashboard</em></p>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>⚙️ Configuration Details</h2>
-                    <pre>{json.dumps(debug_info, indent=2, default=str)}</pre>
-                </div>
-                
-                <div class="section">
-                    <h2>🖥️ System Information</h2>
-                    <pre>{json.dumps(system_info, indent=2, default=str)}</pre>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        return html
+
+        # Jinja compiles the template once per process and auto-escapes
+        # the rendered values; json.dumps runs once per field here
+        return flask.render_template(
+            'oauth_debug.html',
+            oauth_configured=debug_info.get('oauth_configured'),
+            debug_json=json.dumps(debug_info, indent=2, default=str),
+            system_json=json.dumps(system_info, indent=2, default=str)
+        )
+
         
     except Exception as e:
         logger.error(f"Debug page error: {e}")
@@ -931,11 +821,13 @@ app.layout = html.Div([
             html.Button("Analytics", id="overlay-nav-analytics"),
             html.Button("Reports", id="overlay-nav-reports"),
             
-            # Theme buttons (exist in hover overlay - all layouts)
-            html.Button("Dark", id="theme-dark"),
-            html.Button("Light", id="theme-light"),
-            html.Button("High Contrast", id="theme-high_contrast"),
-            html.Button("Swaccha Green", id="theme-swaccha_green"),
+            # Theme buttons (exist in hover overlay - all layouts);
+            # pattern-matching ids feed the single ALL-input callback
+            html.Div([
+                html.Button(theme_key.replace('_', ' ').title(),
+                            id={'type': 'theme-btn', 'name': theme_key})
+                for theme_key in THEMES
+            ]),
             
             # Login page buttons (only exist when on login page)
             html.Button("Back to Public", id="back-to-public-btn"),
@@ -975,7 +867,6 @@ app.layout = html.Div([
             html.Button("Login Redirect", id="login-redirect-btn"),
             html.Div(id="countdown-display"),
             dcc.Interval(id='unauthorized-redirect-timer', interval=5000, n_intervals=0, max_intervals=1),
-            dcc.Interval(id='unauthorized-countdown-timer', interval=1000, n_intervals=0, max_intervals=5),
             
             # Filter components needed by consolidated callbacks
             html.Button("Apply", id="analytics-filter-container-apply-btn"),
@@ -1764,22 +1655,30 @@ def handle_placeholder_nav(back_clicks, current_page, is_authenticated):
 
 # 8. Unauthorized access callbacks
 
-# Countdown display callback
-@callback(
+# Countdown display - driven entirely in the browser. The old version
+# ticked a second dcc.Interval and made 5 server round-trips per
+# unauthorized visit just to change a digit; a local timer needs none.
+clientside_callback(
+    """
+    function(n_intervals) {
+        if (n_intervals > 0) return window.dash_clientside.no_update;
+        const el = document.getElementById('countdown-display');
+        if (!el) return window.dash_clientside.no_update;
+        const start = performance.now();
+        const tick = () => {
+            const remaining = Math.max(0, 5 - Math.floor((performance.now() - start) / 1000));
+            el.textContent = String(remaining);
+            if (remaining > 0 && document.getElementById('countdown-display')) {
+                setTimeout(tick, 250);
+            }
+        };
+        tick();
+        return window.dash_clientside.no_update;
+    }
+    """,
     Output('countdown-display', 'children'),
-    [Input('unauthorized-countdown-timer', 'n_intervals')],
-    [State('current-page', 'data')],
-    prevent_initial_call=True
+    Input('unauthorized-redirect-timer', 'n_intervals')
 )
-def update_countdown_display(n_intervals, current_page):
-    """Update countdown display"""
-    if current_page != 'unauthorized_access':
-        raise PreventUpdate
-    
-    remaining_seconds = 5 - n_intervals
-    if remaining_seconds <= 0:
-        return "0"
-    return str(remaining_seconds)
 
 def kadapa_rayachoti_layout():
     """Enhanced dashboard for Kadapa Rayachoti with interactive elements"""
@@ -2163,20 +2062,25 @@ table tr:hover {
 # Add the CSS to your app (in your main.py where you initialize the Dash app)
 # app.index_string = app.index_string.replace('</head>', f'<style>{app_styles}</style></head>')
 
-# Auto-redirect callback
-@callback(
+# Auto-redirect - handled clientside so the 5-second mark doesn't cost a
+# server round-trip. The page guard mirrors the old server callback:
+# the timer lives in the hidden component registry on every page, so the
+# redirect must only fire on the unauthorized page.
+clientside_callback(
+    """
+    function(n_intervals, current_page) {
+        if (!n_intervals || current_page !== 'unauthorized_access') {
+            return window.dash_clientside.no_update;
+        }
+        console.log('DEBUG: Auto-redirecting to public dashboard after 5 seconds');
+        return '/';
+    }
+    """,
     Output('url', 'pathname', allow_duplicate=True),
-    [Input('unauthorized-redirect-timer', 'n_intervals')],
-    [State('current-page', 'data')],
+    Input('unauthorized-redirect-timer', 'n_intervals'),
+    State('current-page', 'data'),
     prevent_initial_call=True
 )
-def auto_redirect_to_public(n_intervals, current_page):
-    """Auto-redirect to public dashboard after 5 seconds"""
-    if current_page != 'unauthorized_access' or n_intervals == 0:
-        raise PreventUpdate
-    
-    print("DEBUG: Auto-redirecting to public dashboard after 5 seconds")
-    return '/'
 
 # Manual redirect callbacks
 @callback(
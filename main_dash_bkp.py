@@ -31,7 +31,7 @@ from file_watcher import start_file_monitoring, stop_file_monitoring
 from layouts.admin_dashboard import register_enhanced_csv_routes
 # ❌ REMOVED: from callbacks.filter_container_callbacks import register_filter_container_callbacks
 from data_loader import get_cached_data, refresh_cached_data
-from layouts.unauthorized_layout import create_unauthorized_layout, UNAUTHORIZED_CSS
+from layouts.unauthorized_layout import create_unauthorized_layout
 from services.auth_service import auth_service
 # ❌ REMOVED: from callbacks.dashboard_filter_callbacks import register_dashboard_filter_callbacks
 # ✅ FIXED: Import dashboard routes but with custom registration to avoid conflicts
@@ -128,7 +128,6 @@ app.index_string = f'''
         <link rel="manifest" href="/assets/manifest.json">
         <style>
             {get_hover_overlay_css()}
-            {UNAUTHORIZED_CSS}
             
             /* Enhanced Google OAuth styling */
             #google-login-btn, #google-login-btn-alt {{
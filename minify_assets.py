@@ -0,0 +1,91 @@
+# minify_assets.py
+"""
+Deploy-time CSS minify + precompress step
+
+Walks assets/ for stylesheets, writes a .min.css next to each one and a
+.min.css.gz precompressed copy, so nothing is minified or gzipped at
+request time. Run before deploying:
+
+    python minify_assets.py
+"""
+
+import gzip
+import os
+import re
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ASSETS_DIR = "assets"
+
+
+def minify_css(css_text):
+    """Basic CSS minification: strip comments and collapse whitespace"""
+    # Remove comments
+    css_text = re.sub(r'/\*.*?\*/', '', css_text, flags=re.DOTALL)
+    # Collapse runs of whitespace
+    css_text = re.sub(r'\s+', ' ', css_text)
+    # Drop spaces around punctuation
+    css_text = re.sub(r'\s*([{};:,>])\s*', r'\1', css_text)
+    # Drop trailing semicolons before closing braces
+    css_text = css_text.replace(';}', '}')
+    return css_text.strip()
+
+
+def write_precompressed(path, data):
+    """Write <path>.gz (and <path>.br when brotli is installed)"""
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(data, compresslevel=9))
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+
+
+def process_stylesheet(path):
+    """Write <name>.min.css plus precompressed siblings next to the source
+
+    The original file also gets .gz/.br siblings: stylesheets that layouts
+    link under their original name (and everything Dash auto-loads from
+    assets/) are served through the precompressed-sibling hook in main.py,
+    which keys on the requested path.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        original = f.read()
+
+    minified = minify_css(original)
+    min_path = path[:-len('.css')] + '.min.css'
+
+    with open(min_path, 'w', encoding='utf-8') as f:
+        f.write(minified)
+
+    write_precompressed(path, original.encode('utf-8'))
+    write_precompressed(min_path, minified.encode('utf-8'))
+
+    return len(original), len(minified), os.path.getsize(min_path + '.gz')
+
+
+def main():
+    total_before = total_after = total_gz = 0
+
+    for root, _dirs, files in os.walk(ASSETS_DIR):
+        for filename in sorted(files):
+            if not filename.endswith('.css') or filename.endswith('.min.css'):
+                continue
+            path = os.path.join(root, filename)
+            before, after, gz_size = process_stylesheet(path)
+            total_before += before
+            total_after += after
+            total_gz += gz_size
+            print(f"✅ {path}: {before} → {after} bytes (gz {gz_size})")
+
+    if total_before:
+        print(f"📦 Total: {total_before} → {total_after} bytes "
+              f"({100 - total_after * 100 // total_before}% smaller, gz {total_gz})")
+    else:
+        print(f"⚠️ No stylesheets found under {ASSETS_DIR}/")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,13 +4,25 @@ Theme utility functions
 Handles theme styling and CSS generation
 """
 
+from functools import lru_cache
+
 from config.themes import THEMES, DEFAULT_THEME
 
+@lru_cache(maxsize=8)
 def get_theme_styles(theme_name=None):
-    """Generate style dictionaries for a theme"""
+    """Generate style dictionaries for a theme
+
+    Memoized per theme name - the themes are fixed at import, so every
+    caller shares one set of style dicts instead of rebuilding them per
+    layout call. Treat the returned dicts as frozen: spread-merge
+    ({**style, ...}) to derive variants, never mutate in place.
+    (MappingProxyType freezing was considered, but plotly's JSON encoder
+    cannot serialize mappingproxy and several callers pass these dicts
+    straight into component style attributes.)
+    """
     if theme_name is None:
         theme_name = DEFAULT_THEME
-        
+
     theme = THEMES.get(theme_name, THEMES[DEFAULT_THEME])
     
     return {